@@ -0,0 +1,48 @@
+# benchmarks/bench_camera.py
+"""
+Costo por cuadro de ``Level.render`` con cámara en laberintos de distintos
+tamaños: debería depender del tamaño de la pantalla, no del mapa.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_camera
+"""
+import time
+
+import pygame
+
+from game.camera import Camera
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.level import Level
+from game.maze import generate_maze
+from game.simulation import init_headless
+
+SIZES = (21, 101, 401, 1001)
+FRAMES = 600
+
+
+def main():
+    init_headless()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'tamaño':>10} {'carga (ms)':>11} {'ms/cuadro':>10} {'bloques':>8}")
+    for size in SIZES:
+        start = time.perf_counter()
+        level = Level(generate_maze(size, size, "sidewinder", braid_amount=0.5, seed=0), screen)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        camera = Camera(level.pixel_size())
+        width, height = level.pixel_size()
+        target = pygame.Rect(0, 0, 48, 64)
+        start = time.perf_counter()
+        for frame in range(FRAMES):
+            # Recorrido diagonal a 3 píxeles por cuadro, como el jugador
+            target.topleft = ((frame * 3) % width, (frame * 3) % height)
+            camera.follow(target)
+            level.render(camera)
+        frame_ms = (time.perf_counter() - start) * 1000 / FRAMES
+        print(f"{size}x{size:<5} {load_ms:>11.1f} {frame_ms:>10.3f} {len(level.chunks):>8}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
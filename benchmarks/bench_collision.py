@@ -0,0 +1,69 @@
+# benchmarks/bench_collision.py
+"""
+Micro-benchmark de colisiones: recorrido completo de ``Level.tiles`` contra
+la rejilla de ocupación de ``Level``.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_collision
+"""
+import os
+import random
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from game.level import Level
+from game.maze import Grid
+from game.player import Player
+from game.utils import resource_path
+
+
+def random_grid(cols, rows, density=0.3, seed=0):
+    """
+    Rejilla aleatoria con borde de paredes.
+
+    Se pasa directamente a ``Level``: no tiene meta, así que como archivo de
+    texto no pasaría la validación de ``game.levelcompiler``.
+    """
+    rng = random.Random(seed)
+    grid = bytearray(
+        1 if x in (0, cols - 1) or y in (0, rows - 1) or rng.random() < density else 0
+        for y in range(rows) for x in range(cols)
+    )
+    return Grid(cols, rows, grid)
+
+
+def bench(level, player, number):
+    """Devuelve los microsegundos por consulta de ambos métodos."""
+    scan = timeit.timeit(lambda: player.collides_with(level.tiles), number=number)
+    grid = timeit.timeit(lambda: player.collides_with(level), number=number)
+    return scan / number * 1e6, grid / number * 1e6
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((1, 1))
+    player = Player(38, 45)
+
+    cases = [("level1", resource_path("assets/levels/level1.txt")),
+             ("level2", resource_path("assets/levels/level2.txt"))]
+    for size in (50, 200, 400):
+        cases.append((f"{size}x{size}", random_grid(size, size)))
+
+    print(f"{'nivel':>10} {'paredes':>8} {'scan (us)':>10} {'grid (us)':>10} {'x':>8}")
+    for name, source in cases:
+        level = Level(source, screen)
+        walls = sum(len(row) for row in level.tiles)
+        number = max(20, 200000 // max(walls, 1))
+        scan, grid = bench(level, player, number)
+        print(f"{name:>10} {walls:>8} {scan:>10.2f} {grid:>10.2f} {scan / grid:>8.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_fov.py
+"""
+Tiempos del campo de visión (shadowcasting) y de la capa de niebla en
+laberintos de varios tamaños y con varios radios.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_fov
+"""
+import time
+
+import numpy as np
+import pygame
+
+from game.maze import generate_maze
+from game.simulation import init_headless
+from game.visibility import FieldOfView, Fog, shadowcast
+
+SIZES = (51, 201, 1001, 2001)
+RADII = (4, 8, 16)
+QUERIES = 200
+
+
+def free_cells(grid, count, seed=0):
+    """Celdas libres al azar de la rejilla, como (col, row)."""
+    walls = np.frombuffer(grid.grid, dtype=np.uint8).reshape(grid.rows, grid.cols)
+    rows, cols = np.nonzero(walls == 0)
+    picks = np.random.default_rng(seed).integers(0, len(rows), size=count)
+    return list(zip(cols[picks].tolist(), rows[picks].tolist()))
+
+
+def main():
+    init_headless()
+    pygame.display.set_mode((800, 600))
+    view = pygame.Rect(0, 0, 800, 600)
+
+    print(f"{'tamaño':>10} {'radio':>6} {'cálculo (us)':>13} {'caché (us)':>11} {'niebla (ms)':>12} {'celdas vistas':>14}")
+    for size in SIZES:
+        grid = generate_maze(size, size, "sidewinder", braid_amount=0.5, seed=0)
+        cells = free_cells(grid, QUERIES)
+        for radius in RADII:
+            begin = time.perf_counter()
+            seen = sum(sum(shadowcast(grid, cell, radius)) for cell in cells)
+            compute_us = (time.perf_counter() - begin) * 1e6 / QUERIES
+
+            field_of_view = FieldOfView(grid, radius, cache_size=QUERIES)
+            for cell in cells:
+                field_of_view.visible(cell)
+            begin = time.perf_counter()
+            for cell in cells:
+                field_of_view.visible(cell)
+            cached_us = (time.perf_counter() - begin) * 1e6 / QUERIES
+
+            fog = Fog(grid, radius)
+            begin = time.perf_counter()
+            for cell in cells[:20]:
+                fog.build(cell, view.move(cell[0] * 40 - 400, cell[1] * 40 - 300))
+            fog_ms = (time.perf_counter() - begin) * 1000 / 20
+            print(f"{size}x{size:<5} {radius:>6} {compute_us:>13.1f} {cached_us:>11.2f} {fog_ms:>12.3f} "
+                  f"{seen / QUERIES:>14.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
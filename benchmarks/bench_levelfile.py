@@ -0,0 +1,49 @@
+# benchmarks/bench_levelfile.py
+"""
+Tiempo de carga de niveles: formato de texto contra formato binario (``.lvl``).
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_levelfile
+"""
+import os
+import tempfile
+import time
+
+from game.levelfile import convert, parse_text, read_level
+from game.maze import generate_maze, write_level
+
+SIZES = (101, 1001, 4001)
+
+
+def read_text(path):
+    with open(path, "r") as file:
+        return parse_text([line.strip() for line in file])
+
+
+def best_of(function, path, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(path)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    tmpdir = tempfile.mkdtemp()
+    print(f"{'tamaño':>10} {'texto (KB)':>11} {'lvl (KB)':>9} {'texto (ms)':>11} {'lvl (ms)':>9} {'x':>6}")
+    for size in SIZES:
+        text_path = os.path.join(tmpdir, f"maze_{size}.txt")
+        binary_path = os.path.join(tmpdir, f"maze_{size}.lvl")
+        write_level(generate_maze(size, size, "sidewinder", braid_amount=0.5, seed=0), text_path)
+        convert(text_path, binary_path, spawn=(1, 1))
+
+        text_ms = best_of(read_text, text_path)
+        binary_ms = best_of(read_level, binary_path)
+        print(f"{size}x{size:<5} {os.path.getsize(text_path) / 1024:>11.0f} "
+              f"{os.path.getsize(binary_path) / 1024:>9.0f} {text_ms:>11.1f} {binary_ms:>9.2f} "
+              f"{text_ms / binary_ms:>6.0f}")
+
+
+if __name__ == "__main__":
+    main()
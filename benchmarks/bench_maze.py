@@ -0,0 +1,61 @@
+# benchmarks/bench_maze.py
+"""
+Tiempos de generación de laberintos, búsqueda de caminos y cálculo de
+campos de distancia en rejillas de varios tamaños.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_maze
+"""
+import time
+
+import numpy as np
+
+from game.config import CHASE_RADIUS
+from game.maze import GENERATORS, FlowField, astar, bfs, distance_field, distance_window, generate_maze
+
+SIZES = (51, 201, 501, 1001)
+GENERATION_SIZES = (501, 1001, 2001, 4001)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'tamaño':>10} " + " ".join(f"{name + ' (s)':>16}" for name in GENERATORS))
+    for size in GENERATION_SIZES:
+        times = [timed(generate_maze, size, size, name, 0.0, 0)[1] / 1000 for name in GENERATORS]
+        print(f"{size}x{size:<5} " + " ".join(f"{seconds:>16.2f}" for seconds in times))
+    print()
+
+    print(f"{'tamaño':>10} {'campo (ms)':>11} {'radio (ms)':>11} {'caché (us)':>11} {'1k dirs (us)':>13} "
+          f"{'bfs (ms)':>9} {'a* (ms)':>9}")
+    for size in SIZES:
+        grid = generate_maze(size, size, "sidewinder", braid_amount=0.5, seed=0)
+        start, goal = (1, 1), grid.goal
+        _, field_ms = timed(distance_field, grid, goal)
+        _, window_ms = timed(distance_window, grid, goal, CHASE_RADIUS)  # Lo que cuesta cada celda nueva en el juego
+
+        flow = FlowField(grid, radius=None)
+        flow.distances(goal)
+        begin = time.perf_counter()
+        for _ in range(1000):
+            flow.distances(goal)
+        cached_us = (time.perf_counter() - begin) * 1000
+
+        cells = np.random.default_rng(1).integers(0, size, size=(1000, 2))
+        begin = time.perf_counter()
+        for _ in range(100):
+            flow.directions(cells, goal)
+        directions_us = (time.perf_counter() - begin) * 1e4
+
+        _, bfs_ms = timed(bfs, grid, start, goal)
+        _, astar_ms = timed(astar, grid, start, goal)
+        print(f"{size}x{size:<5} {field_ms:>11.1f} {window_ms:>11.2f} {cached_us:>11.2f} {directions_us:>13.1f} "
+              f"{bfs_ms:>9.1f} {astar_ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
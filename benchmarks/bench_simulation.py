@@ -0,0 +1,43 @@
+# benchmarks/bench_simulation.py
+"""
+Mide cuántos pasos de simulación por segundo se ejecutan sin renderizar.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_simulation
+"""
+import random
+import time
+
+import pygame
+
+from game.simulation import Simulation, init_headless, pressed
+from game.enemy import Enemy
+from game.level import Level
+from game.player import Player
+from game.utils import resource_path
+
+DIRECTIONS = [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT]
+
+
+def main(ticks=20000):
+    screen = init_headless()
+    rng = random.Random(0)
+    inputs = [pressed(key) for key in DIRECTIONS]
+
+    for name in ("level1", "level2"):
+        level = Level(resource_path(f"assets/levels/{name}.txt"), screen)
+        player = Player(38, 45)
+        enemy = Enemy(10_000, 10_000)  # Fuera del alcance del jugador para no cortar la corrida
+        simulation = Simulation(level, player, enemy)
+        simulation.bounds = (20_000, 20_000)
+
+        start = time.perf_counter()
+        simulation.run(ticks, keys=lambda tick: inputs[(tick // 30 + rng.randrange(2)) % 4])
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {simulation.ticks} pasos en {elapsed:.3f} s ({simulation.ticks / elapsed:,.0f} pasos/s)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# benchmarks/bench_swarm.py
+"""
+Escala el número de enemigos de ``EnemySwarm`` y reporta milisegundos por paso
+(movimiento + colisión con el jugador) y por render.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_swarm
+"""
+import time
+
+import numpy as np
+import pygame
+
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game.enemy import Enemy
+from game.level import Level
+from game.simulation import init_headless
+from game.swarm import EnemySwarm
+from game.utils import resource_path
+
+COUNTS = (1, 10, 100, 1000, 5000, 10000)
+
+
+def time_per_call(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main(repeat=200):
+    init_headless()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    level = Level(resource_path("assets/levels/level1.txt"), screen)
+    player_rect = pygame.Rect(38, 45, 48, 64)
+    bounds = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    budget = 1000 / FPS
+
+    # Referencia: N objetos Enemy independientes
+    enemies = [Enemy(400, 300) for _ in range(100)]
+
+    def move_objects():
+        for enemy in enemies:
+            enemy.move(bounds)
+            enemy.collides(player_rect)
+
+    print(f"Enemy x100 (objetos): {time_per_call(move_objects, repeat):.3f} ms/paso")
+    print(f"{'N':>6} {'paso (ms)':>10} {'paso+paredes':>13} {'render (ms)':>12} {'total/{:.1f}ms'.format(budget):>14}")
+    for count in COUNTS:
+        rng = np.random.default_rng(count)
+        positions = rng.uniform((0, 0), (SCREEN_WIDTH - 120, SCREEN_HEIGHT - 120), size=(count, 2))
+        swarm = EnemySwarm(positions, speed=3, seed=count)
+
+        def step():
+            swarm.move(bounds)
+            swarm.collides(player_rect)
+
+        def step_walls():
+            swarm.move(bounds, level)
+            swarm.collides(player_rect)
+
+        step_ms = time_per_call(step, repeat)
+        walls_ms = time_per_call(step_walls, repeat)
+        render_ms = time_per_call(lambda: swarm.render(screen, 0.5), max(5, repeat // 10))
+        total = step_ms + render_ms
+        print(f"{count:>6} {step_ms:>10.3f} {walls_ms:>13.3f} {render_ms:>12.3f} {total / budget:>13.0%}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+# benchmarks/suite.py
+"""
+Suite de benchmarks sin ventana (drivers ``dummy`` de SDL) para las rutas
+críticas de ``game/``: carga de niveles, colisiones, render de un cuadro
+completo, campo de visión, construcción de ``Enemy`` y movimiento de enemigos, sobre los dos
+niveles incluidos y sobre laberintos sintéticos grandes.
+
+La carga de niveles se mide en frío (``level_load/compile``: lectura,
+validación y fusión de paredes, sin ``.compiled.npz``) y desde el resultado
+compilado en disco (``level_load/npz``); en ambos casos se vacía antes la
+caché en memoria de ``game.levelcompiler``.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks                          # ejecutar y comparar con la línea base
+    python -m benchmarks --output resultados.json
+    python -m benchmarks --update-baseline        # guardar los resultados como nueva línea base
+    python -m benchmarks --filter collision --threshold 0.5
+
+Sale con código 1 si algún caso es más lento que su línea base por encima
+del umbral. El archivo de línea base puede fijar umbrales propios por
+prefijo de nombre en ``"thresholds"`` (por ejemplo, más holgura para los
+casos de microsegundos); ``--update-baseline`` los conserva. Las líneas
+base dependen de la máquina: regenerarlas al cambiar de equipo.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pygame
+
+from game.simulation import init_headless
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DEFAULT_THRESHOLD = 0.5  # 50 % más lento que la línea base se considera regresión
+REPEATS = 7
+
+
+def measure(function, number, repeats=REPEATS):
+    """Milisegundos por llamada: mediana y mínimo de ``repeats`` tandas de ``number`` llamadas."""
+    results = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        results.append((time.perf_counter() - start) * 1000 / number)
+    return {"median_ms": statistics.median(results), "min_ms": min(results), "calls": number}
+
+
+def level_sources(tmpdir):
+    """Niveles incluidos y laberintos sintéticos (texto) para los casos parametrizados."""
+    from game.maze import generate_maze, write_level
+    from game.utils import resource_path
+
+    sources = {
+        "level1": resource_path("assets/levels/level1.txt"),
+        "level2": resource_path("assets/levels/level2.txt"),
+    }
+    for size in (201, 1001):
+        path = os.path.join(tmpdir, f"maze_{size}.txt")
+        write_level(generate_maze(size, size, "sidewinder", braid_amount=0.5, seed=0), path)
+        sources[f"maze{size}"] = path
+    return sources
+
+
+def build_cases(screen, tmpdir):
+    """
+    Devuelve la lista de casos ``(nombre, función, llamadas por tanda)``.
+
+    La preparación de cada caso (cargar el nivel, crear al jugador...) ocurre
+    aquí, fuera de la medición.
+    """
+    from game import levelcompiler
+    from game.assets import cache
+    from game.camera import Camera
+    from game.config import NIGHT_OPACITY
+    from game.enemy import Enemy
+    from game.level import Level
+    from game.lighting import Lighting
+    from game.player import Player
+    from game.simulation import pressed
+    from game.swarm import EnemySwarm
+    from game.visibility import FieldOfView, Fog, shadowcast
+
+    cases = []
+    sources = level_sources(tmpdir)
+    lighting = Lighting(NIGHT_OPACITY)
+    keys = [pressed(key) for key in (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP)]
+
+    for name, path in sources.items():
+        big = name.startswith("maze")
+
+        def load_compile(path=path):
+            levelcompiler._compiled.clear()
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(levelcompiler.compiled_path(path))
+            Level(path, screen)
+
+        def load_npz(path=path):
+            levelcompiler._compiled.clear()
+            Level(path, screen)
+
+        cases.append((f"level_load/compile/{name}", load_compile, 2 if big else 20))
+        cases.append((f"level_load/npz/{name}", load_npz, 2 if big else 20))
+
+        level = Level(path, screen)
+        player = Player(38, 45)
+        step = [0]
+
+        def handle_input(player=player, level=level, step=step):
+            # Vaivén en las cuatro direcciones alrededor de la posición inicial
+            player.handle_input(level, keys[(step[0] // 10) % 4])
+            step[0] += 1
+
+        cases.append((f"collision/grid/{name}", handle_input, 2000))
+        cases.append((f"collision/tiles/{name}",
+                      lambda player=player, level=level: player.collides_with(level.tiles), 10 if big else 2000))
+
+        camera = Camera(level.pixel_size())
+        camera.follow(player.rect)
+
+        def render_frame(level=level, camera=camera):
+            level.render(camera)
+            lighting.render(screen)
+
+        cases.append((f"render_frame/{name}", render_frame, 200))
+
+        # Campo de visión desde la esquina (1, 1): cálculo, consulta cacheada y capa de niebla
+        field_of_view = FieldOfView(level)
+        fog = Fog(level)
+        cases.append((f"fov/compute/{name}", lambda level=level: shadowcast(level, (1, 1)), 200))
+        cases.append((f"fov/cached/{name}", lambda fov=field_of_view: fov.visible((1, 1)), 5000))
+        cases.append((f"fov/fog_build/{name}", lambda fog=fog, camera=camera: fog.build((1, 1), camera.rect), 50))
+
+    def construct_cold():
+        cache.clear()
+        Enemy(400, 300)
+
+    cases.append(("enemy/construct_cold", construct_cold, 2))
+    cases.append(("enemy/construct_cached", lambda: Enemy(400, 300), 50))
+
+    enemy = Enemy(400, 300)
+    bounds = screen.get_size()
+    cases.append(("enemy/move", lambda: enemy.move(bounds), 5000))
+
+    for count in (1, 100, 1000):
+        positions = np.random.default_rng(count).uniform((0, 0), (680, 480), size=(count, 2))
+        swarm = EnemySwarm(positions, speed=3, seed=count)
+        cases.append((f"swarm/move/{count}", lambda swarm=swarm: swarm.move(bounds), 500))
+    return cases
+
+
+def threshold_for(name, thresholds, default):
+    """Umbral del caso: el del prefijo más largo que coincida, o ``default``."""
+    matches = [prefix for prefix in thresholds if name.startswith(prefix)]
+    return thresholds[max(matches, key=len)] if matches else default
+
+
+def compare(results, baseline, threshold, thresholds=None):
+    """
+    Devuelve la lista de casos más lentos que la línea base por encima del umbral.
+
+    Se compara el mínimo de las tandas, que es la medida menos sensible al ruido de la máquina.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        ratio = result["min_ms"] / reference["min_ms"]
+        if ratio > 1 + threshold_for(name, thresholds or {}, threshold):
+            regressions.append((name, reference["min_ms"], result["min_ms"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks sin ventana de game/")
+    parser.add_argument("--output", help="guardar los resultados en este archivo JSON")
+    parser.add_argument("--baseline", default=BASELINE, help="línea base para comparar (JSON)")
+    parser.add_argument("--update-baseline", action="store_true", help="reemplazar la línea base con estos resultados")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="tolerancia relativa por defecto antes de marcar una regresión (0.5 = 50 %%)")
+    parser.add_argument("--filter", default="", help="ejecutar solo los casos cuyo nombre contenga este texto")
+    args = parser.parse_args(argv)
+
+    init_headless()
+    screen = pygame.display.set_mode((800, 600))
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, function, number in build_cases(screen, tmpdir):
+            if args.filter not in name:
+                continue
+            function()  # Calentamiento
+            results[name] = measure(function, number)
+            print(f"{name:<34} {results[name]['median_ms']:>10.4f} ms")
+    pygame.quit()
+
+    previous = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            previous = json.load(file)
+    thresholds = previous.get("thresholds", {})
+
+    document = {
+        "machine": {"python": platform.python_version(), "pygame": pygame.version.ver,
+                    "platform": platform.platform()},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(document, file, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump({**document, "thresholds": thresholds}, file, indent=2)
+        print(f"Línea base actualizada: {args.baseline}")
+        return 0
+
+    if not previous:
+        print("Sin línea base; ejecutar con --update-baseline para crearla.")
+        return 0
+    regressions = compare(results, previous["results"], args.threshold, thresholds)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESIÓN {name}: {before:.4f} ms -> {after:.4f} ms ({ratio:.2f}x)")
+    if not regressions:
+        print(f"Sin regresiones (umbral por defecto {args.threshold:.0%}).")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+# game/assets.py
+import os
+import sys
+import warnings
+from collections import OrderedDict
+
+import pygame
+
+from game.atlas import load_index, source_key
+from game.config import ASSET_BUDGET, ASSET_BUDGET_POLICY
+from game.utils import resource_path
+
+PRELOAD_OWNER = "preload"  # Dueño provisorio de lo que entrega game.preload (se reemplaza en el primer uso)
+
+
+class AssetBudgetWarning(UserWarning):
+    """La caché superó su presupuesto con la política ``"warn"``."""
+
+
+def surface_bytes(surface):
+    """Bytes de píxeles propios de una superficie (0 si es subsuperficie: comparte los de su padre)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def surface_format(surface):
+    """Formato de píxel legible, p. ej. ``"RGBA32"``, ``"RGB24"`` o ``"P8"`` (con paleta)."""
+    bits = surface.get_bitsize()
+    if bits == 8:
+        return "P8"
+    return ("RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB") + str(bits)
+
+
+def _requester():
+    """Clase (o módulo) fuera de este archivo que pidió el recurso."""
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_globals.get("__name__") == __name__:
+        frame = frame.f_back
+    if frame is None:
+        return None
+    instance = frame.f_locals.get("self")
+    return type(instance).__name__ if instance is not None else frame.f_globals.get("__name__")
+
+
+class _Entry:
+    """Recurso cacheado y su contabilidad."""
+
+    __slots__ = ("asset", "size", "category", "owner", "pixel_format", "pinned")
+
+    def __init__(self, asset, size, category, owner, pixel_format):
+        self.asset = asset
+        self.size = size
+        self.category = category
+        self.owner = owner
+        self.pixel_format = pixel_format
+        self.pinned = False  # Nunca se descarta (atlas de los que se recortan los cuadros)
+
+
+class AssetCache:
+    """
+    Caché de recursos compartida por todo el proceso.
+
+    Guarda superficies ya decodificadas, recortadas, escaladas y convertidas
+    al formato de la pantalla, y objetos ``Sound``, indexados por ruta y
+    transformación. Cada entrada registra sus bytes, su formato de píxel,
+    su categoría (la carpeta de la imagen o ``sounds``) y su dueño
+    (la clase que la pidió primero); ``report`` da los totales.
+
+    Cuando el tamaño supera ``max_bytes``, con la política ``"evict"`` se
+    descartan primero los recursos usados hace más tiempo (LRU), salvo los
+    atlas: cada cuadro que falta se recorta de su atlas, y descartarlo
+    obligaría a decodificarlo de nuevo en cada fallo. Con
+    ``"warn"`` no se descarta nada y se emite un ``AssetBudgetWarning``
+    cada vez que se cruza el presupuesto. Descartar solo libera memoria si
+    nadie más conserva el recurso (``Player``, ``Level``... guardan los suyos).
+    """
+
+    def __init__(self, max_bytes=ASSET_BUDGET, policy=ASSET_BUDGET_POLICY):
+        """
+        Args:
+            max_bytes (int): Presupuesto de memoria en bytes.
+            policy (str): ``"evict"`` (descartar por LRU) o ``"warn"`` (solo avisar).
+        """
+        if policy not in ("evict", "warn"):
+            raise ValueError(f"política de presupuesto desconocida: {policy!r}")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.over_budget = False
+        self._entries = OrderedDict()  # clave -> _Entry
+        self._listings = {}  # carpeta -> nombres de archivo ordenados
+        self._prepared = {}  # recursos ya decodificados en otro hilo, pendientes de entrar a la caché
+        self._atlas_frames = None  # índice de game.atlas, leído en el primer uso
+        self._atlas_folders = None
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        if entry.owner == PRELOAD_OWNER:
+            entry.owner = _requester()
+        return entry.asset
+
+    def _put(self, key, asset, size, pixel_format=None, owner=None):
+        kind, relative_path = key[:2]
+        category = os.path.basename(os.path.dirname(relative_path)) if kind == "image" else f"{kind}s"
+        entry = self._entries[key] = _Entry(asset, size, category, owner or _requester(), pixel_format)
+        self.used_bytes += size
+        self._enforce_budget(entry)
+        return asset
+
+    def _enforce_budget(self, added):
+        if self.used_bytes <= self.max_bytes:
+            self.over_budget = False
+            return
+        if self.policy == "warn":
+            if not self.over_budget:
+                largest = max(self.report()["categories"].items(), key=lambda item: item[1]["bytes"])
+                warnings.warn(f"recursos: {self.used_bytes / 2 ** 20:.1f} MiB, presupuesto "
+                              f"{self.max_bytes / 2 ** 20:.1f} MiB, superado al cargar un recurso de "
+                              f"{added.owner} (la categoría más grande es {largest[0]!r}, "
+                              f"{largest[1]['bytes'] / 2 ** 20:.1f} MiB)", AssetBudgetWarning)
+            self.over_budget = True
+            return
+        # Nunca se descartan el recurso recién insertado ni los fijados; las entradas sin
+        # bytes propios (subsuperficies) no liberan nada
+        for key in list(self._entries):
+            if self.used_bytes <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry is added or entry.pinned or not entry.size:
+                continue
+            del self._entries[key]
+            self.used_bytes -= entry.size
+            self.evictions += 1
+        self.over_budget = self.used_bytes > self.max_bytes  # Solo quedan recursos fijados o recién insertados
+
+    def image(self, relative_path, size=None, area=None, alpha=True, owner=None):
+        """
+        Devuelve una imagen cacheada.
+
+        Args:
+            relative_path (str): Ruta relativa del recurso (se resuelve con ``resource_path``).
+            size (tuple): Tamaño final (ancho, alto), o None para no escalar.
+            area (tuple): Recorte (x, y, ancho, alto) aplicado antes de escalar.
+            alpha (bool): Convierte con ``convert_alpha`` en vez de ``convert``.
+            owner (str): Dueño para la contabilidad; por defecto, la clase que la pide.
+        """
+        converted = pygame.display.get_surface() is not None
+        area = tuple(area) if area is not None else None
+        size = tuple(size) if size is not None else None
+        key = ("image", relative_path, area, size, alpha, converted)
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        surface = self._prepared.pop(("image", relative_path, area, size), None)
+        packed = self.packed(relative_path, area) if surface is None else None
+        if surface is not None:
+            pass  # Recortada y escalada por game.preload; solo falta convertirla
+        elif packed is not None:
+            # Cuadro de un atlas (game.atlas): se parte del atlas ya decodificado y convertido
+            atlas_path, rect = packed
+            surface = self.image(atlas_path, alpha=alpha, owner=owner).subsurface(rect)
+            atlas = self._entries.get(("image", atlas_path, None, None, alpha, converted))
+            if atlas is not None:
+                atlas.pinned = True
+            if size is None:
+                return self._put(key, surface, 0, surface_format(surface), owner)  # Comparte los píxeles del atlas
+        elif area is not None:
+            surface = self.image(relative_path, alpha=alpha, owner=owner).subsurface(pygame.Rect(area))
+        else:
+            surface = pygame.image.load(resource_path(relative_path))
+        if size is not None and surface.get_size() != size:
+            surface = pygame.transform.scale(surface, size)
+        if converted and packed is None:  # El atlas ya está convertido
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        elif area is not None and size is None:
+            surface = surface.copy()  # No mantener la hoja completa viva por un recorte
+
+        return self._put(key, surface, surface_bytes(surface), surface_format(surface), owner)
+
+    def _load_atlas_index(self):
+        if self._atlas_frames is None:
+            self._atlas_frames, self._atlas_folders = load_index()
+
+    def packed(self, relative_path, area=None):
+        """
+        Busca una imagen (o un recorte) en los atlas generados con ``python -m game.atlas``.
+
+        Returns:
+            tuple: ``(ruta del atlas, rectángulo)``, o None si la imagen no está empaquetada.
+        """
+        self._load_atlas_index()
+        if not self._atlas_frames:
+            return None
+        return self._atlas_frames.get(source_key(relative_path, area))
+
+    def listing(self, relative_folder):
+        """Nombres de los archivos ``.png`` de una carpeta, en orden alfabético."""
+        names = self._listings.get(relative_folder)
+        if names is None:
+            self._load_atlas_index()
+            names = self._atlas_folders.get(relative_folder)  # Carpetas empaquetadas (sin os.listdir)
+            if names is None:
+                folder = resource_path(relative_folder)
+                names = [name for name in sorted(os.listdir(folder)) if name.endswith(".png")]
+            self._listings[relative_folder] = names
+        return names
+
+    def frames(self, relative_folder, size=None):
+        """Devuelve los cuadros ``.png`` de una carpeta, en orden alfabético."""
+        return [self.image(os.path.join(relative_folder, name), size=size) for name in self.listing(relative_folder)]
+
+    def sound(self, relative_path, owner=None):
+        """Devuelve un ``pygame.mixer.Sound`` compartido."""
+        key = ("sound", relative_path)
+        sound = self._get(key)
+        if sound is not None:
+            return sound
+
+        sound = self._prepared.pop(key, None) or pygame.mixer.Sound(resource_path(relative_path))
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        size = int(sound.get_length() * frequency * channels * (abs(sample_format) // 8))
+        return self._put(key, sound, size, f"{frequency}Hz/{abs(sample_format)}bit/{channels}ch", owner)
+
+    def prepare(self, key, asset):
+        """
+        Entrega un recurso decodificado fuera del hilo principal (ver ``game.preload``).
+
+        La próxima llamada a ``image`` o ``sound`` con la misma clave lo usa
+        en lugar de leer el archivo; ``image`` solo tiene que convertirlo.
+
+        Args:
+            key (tuple): ``("image", ruta, recorte, tamaño)`` o ``("sound", ruta)``.
+            asset: Superficie sin convertir o ``Sound``.
+        """
+        self._prepared[key] = asset
+
+    def stats(self):
+        """Devuelve los contadores de la caché."""
+        return {
+            "entries": len(self._entries),
+            "used_bytes": self.used_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "policy": self.policy,
+            "over_budget": self.over_budget,
+        }
+
+    def report(self):
+        """
+        Totales de memoria de los recursos cacheados.
+
+        Returns:
+            dict: ``used_bytes``, ``max_bytes`` y, por ``categories``, ``owners`` y
+            ``formats``, un diccionario nombre -> ``{"count", "bytes"}`` (de mayor a menor).
+        """
+        totals = {"categories": {}, "owners": {}, "formats": {}}
+        for entry in self._entries.values():
+            for group, name in (("categories", entry.category), ("owners", entry.owner),
+                                ("formats", entry.pixel_format)):
+                total = totals[group].setdefault(str(name), {"count": 0, "bytes": 0})
+                total["count"] += 1
+                total["bytes"] += entry.size
+        report = {"used_bytes": self.used_bytes, "max_bytes": self.max_bytes}
+        for group, values in totals.items():
+            report[group] = dict(sorted(values.items(), key=lambda item: -item[1]["bytes"]))
+        return report
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)."""
+        self._entries.clear()
+        self._listings.clear()
+        self._prepared.clear()
+        self.used_bytes = 0
+        self.over_budget = False
+
+
+# Instancia compartida por Enemy, Player y Level
+cache = AssetCache()
+
+
+def format_report(report):
+    """Líneas de texto con los totales de ``AssetCache.report``."""
+    lines = [f"Recursos: {report['used_bytes'] / 2 ** 20:.2f} MiB de {report['max_bytes'] / 2 ** 20:.0f} MiB"]
+    for group, title in (("categories", "categoría"), ("owners", "dueño"), ("formats", "formato")):
+        lines.append(f"  Por {title}:")
+        for name, total in report[group].items():
+            lines.append(f"    {name:<20} {total['count']:>4} {total['bytes'] / 2 ** 20:>8.2f} MiB")
+    return lines
+
+
+def load_image(relative_path, size=None, area=None, alpha=True):
+    """Atajo a ``cache.image``."""
+    return cache.image(relative_path, size=size, area=area, alpha=alpha)
+
+
+def load_frames(relative_folder, size=None):
+    """Atajo a ``cache.frames``."""
+    return cache.frames(relative_folder, size=size)
+
+
+def load_sound(relative_path):
+    """Atajo a ``cache.sound``."""
+    return cache.sound(relative_path)
+
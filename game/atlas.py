@@ -0,0 +1,159 @@
+# game/atlas.py
+"""
+Empaquetado de sprites en atlas (paso previo al build con PyInstaller).
+
+Cada atlas es un PNG con cuadros ya recortados y colocados en una grilla,
+más una entrada en ``assets/atlases/index.json`` que indica, para cada
+imagen de origen (ruta y recorte con los que el juego la pide), el
+rectángulo que ocupa en el atlas. En tiempo de ejecución ``AssetCache``
+consulta el índice: si la imagen está empaquetada, parte de una
+subsuperficie del atlas (un único archivo abierto y decodificado por atlas)
+en lugar de abrir el archivo; si no existe el índice, lee los archivos
+sueltos como antes.
+
+Los cuadros se guardan a su tamaño original y se escalan al cargarlos:
+escalados de antemano (120x120 en RGBA) el PNG del enemigo ocupa el doble
+de píxeles y decodificarlo cuesta más que escalar los 126 cuadros.
+
+Construcción (desde la raíz del repositorio; ``main.spec`` lo ejecuta solo):
+    python -m game.atlas
+"""
+import json
+import math
+import os
+
+import pygame
+
+from game.utils import resource_path
+
+ATLAS_FOLDER = "assets/atlases"
+INDEX_FILE = "index.json"
+MAX_WIDTH = 2048
+
+# Lo que se empaqueta: cuadros de la animación del enemigo y recortes de la hoja de árboles
+ENEMY_FRAMES = "assets/images/enemy_frames"
+TREE_SPRITESHEET = "assets/images/Object tree 2.PNG"
+
+
+def enemy_sources():
+    """Cuadros de ``EnemySwarm``/``Enemy``: ``(ruta, recorte)`` por archivo."""
+    names = sorted(name for name in os.listdir(resource_path(ENEMY_FRAMES)) if name.endswith(".png"))
+    return [(os.path.join(ENEMY_FRAMES, name), None) for name in names]
+
+
+def tree_sources():
+    """Recortes de 32x32 de la hoja de árboles (como ``Level.load_spritesheet``)."""
+    return [(TREE_SPRITESHEET, (col * 32, row * 32, 32, 32)) for row in range(4) for col in range(4)]
+
+
+# nombre del atlas -> función que devuelve sus imágenes de origen
+ATLASES = {
+    "enemy": enemy_sources,
+    "trees": tree_sources,
+}
+
+# Carpetas cuyos archivos quedan completamente dentro de un atlas (no hace falta distribuirlas)
+PACKED_FOLDERS = [ENEMY_FRAMES]
+
+
+def source_key(relative_path, area=None):
+    """Clave de una imagen de origen en el índice (rutas con ``/`` en cualquier sistema)."""
+    area = list(area) if area is not None else None
+    return json.dumps([relative_path.replace(os.sep, "/"), area])
+
+
+def pack(name, sources, output_folder):
+    """
+    Recorta y coloca en una grilla las imágenes de ``sources``.
+
+    Args:
+        name (str): Nombre del atlas (y de su PNG).
+        sources (list): ``(ruta, recorte)`` de cada imagen.
+        output_folder (str): Carpeta donde se guarda el PNG.
+
+    Returns:
+        dict: Entrada del índice para este atlas.
+    """
+    sheets = {}
+    images = []
+    for relative_path, area in sources:
+        sheet = sheets.get(relative_path)
+        if sheet is None:
+            sheet = sheets[relative_path] = pygame.image.load(resource_path(relative_path))
+        images.append(sheet.subsurface(pygame.Rect(area)) if area is not None else sheet)
+
+    # Celdas del tamaño de la imagen más grande
+    width = max(image.get_width() for image in images)
+    height = max(image.get_height() for image in images)
+    columns = max(1, min(len(images), MAX_WIDTH // width))
+    rows = math.ceil(len(images) / columns)
+    atlas = pygame.Surface((columns * width, rows * height), pygame.SRCALPHA)
+
+    frames = {}
+    for i, ((relative_path, area), image) in enumerate(zip(sources, images)):
+        if not image.get_flags() & pygame.SRCALPHA:
+            # Paleta o RGB, quizá con color clave: pasar a alfa por píxel (como convert_alpha)
+            rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+            colorkey = image.get_colorkey()
+            if colorkey is not None:
+                rgba.fill((*colorkey[:3], 0))
+            rgba.blit(image, (0, 0))
+            image = rgba
+        x, y = (i % columns) * width, (i // columns) * height
+        atlas.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)  # Copia exacta sobre el fondo transparente
+        frames[source_key(relative_path, area)] = [x, y, *image.get_size()]
+
+    image_name = f"{name}.png"
+    pygame.image.save(atlas, os.path.join(output_folder, image_name))
+    return {"image": f"{ATLAS_FOLDER}/{image_name}", "frames": frames}
+
+
+def build_atlases(output_folder=None):
+    """
+    Genera todos los atlas y el índice.
+
+    Args:
+        output_folder (str): Carpeta de salida; por defecto ``assets/atlases``.
+
+    Returns:
+        dict: El índice escrito.
+    """
+    output_folder = output_folder or resource_path(ATLAS_FOLDER)
+    os.makedirs(output_folder, exist_ok=True)
+    index = {"atlases": {}, "folders": {}}
+    for name, sources in ATLASES.items():
+        index["atlases"][name] = pack(name, sources(), output_folder)
+
+    # Listados de las carpetas empaquetadas, para no depender de os.listdir en el ejecutable
+    for folder in PACKED_FOLDERS:
+        index["folders"][folder] = sorted(name for name in os.listdir(resource_path(folder)) if name.endswith(".png"))
+
+    with open(os.path.join(output_folder, INDEX_FILE), "w") as file:
+        json.dump(index, file)
+    return index
+
+
+def load_index():
+    """
+    Lee el índice de atlas.
+
+    Returns:
+        tuple: ``(frames, folders)``: clave de origen -> (PNG del atlas, rectángulo) y
+        carpeta -> nombres de archivo. Ambos vacíos si los atlas no se generaron.
+    """
+    path = resource_path(os.path.join(ATLAS_FOLDER, INDEX_FILE))
+    if not os.path.exists(path):
+        return {}, {}
+    with open(path) as file:
+        index = json.load(file)
+    frames = {key: (atlas["image"], tuple(rect))
+              for atlas in index["atlases"].values() for key, rect in atlas["frames"].items()}
+    return frames, index["folders"]
+
+
+if __name__ == "__main__":
+    pygame.init()
+    built = build_atlases()
+    for atlas_name, entry in built["atlases"].items():
+        print(f"{atlas_name}: {len(entry['frames'])} cuadros -> {entry['image']}")
+    pygame.quit()
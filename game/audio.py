@@ -0,0 +1,158 @@
+# game/audio.py
+"""
+Administrador de voces: todos los efectos de sonido pasan por aquí.
+
+Cada evento (``"steps"``, ``"flying"``...) tiene un ``Sound`` compartido
+(de la caché de ``game.assets``), una categoría y un intervalo mínimo entre
+reproducciones. Cada categoría tiene su propio grupo de canales reservados,
+así que el trabajo del mezclador queda acotado por la suma de los grupos sin
+importar cuántas entidades emitan sonidos. Si el grupo está lleno, el sonido
+nuevo reemplaza a la voz más baja del grupo (o se descarta si es más bajo
+que todas). El volumen y el paneo dependen de la distancia al oyente
+(normalmente el jugador).
+"""
+import pygame
+
+from game.assets import load_sound
+from game.config import AUDIO_POOLS, HEARING_RADIUS
+
+# evento -> (sonido, categoría, volumen base, intervalo mínimo en milisegundos)
+EVENTS = {
+    "steps": ("assets/sounds/steps.wav", "player", 0.5, 200),
+    "flying": ("assets/sounds/flying.wav", "enemy", 0.5, 120),
+}
+
+
+class _Voice:
+    """Canal reservado y lo que está sonando en él."""
+
+    __slots__ = ("channel", "volume")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.volume = 0.0  # Volumen con el que empezó el sonido actual (prioridad para el robo)
+
+
+class VoiceManager:
+    """Reproduce eventos de sonido con grupos de canales por categoría, límites de frecuencia y atenuación."""
+
+    def __init__(self, pools=AUDIO_POOLS, events=EVENTS, hearing_radius=HEARING_RADIUS):
+        """
+        Args:
+            pools (dict): Categoría -> cantidad de canales reservados.
+            events (dict): Evento -> (ruta del sonido, categoría, volumen base, intervalo mínimo en ms).
+            hearing_radius (float): Distancia (píxeles del mundo) a partir de la cual no se oye nada.
+        """
+        self.pools = dict(pools)
+        self.events = dict(events)
+        self.hearing_radius = hearing_radius
+        self.listener = None  # Posición del oyente; None = todo se oye a volumen completo
+        self.muted = False
+        self._voices = None  # categoría -> [_Voice]; los canales se reservan al primer uso
+        self._last_played = {}  # evento -> ticks de la última reproducción
+        self.stats = {"played": 0, "throttled": 0, "culled": 0, "stolen": 0, "dropped": 0}
+
+    def _reserve_channels(self):
+        """Reserva los canales de todas las categorías (requiere el mezclador inicializado)."""
+        total = sum(self.pools.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)  # Sound.play() sin canal no los usa
+        self._voices = {}
+        index = 0
+        for category, size in self.pools.items():
+            self._voices[category] = [_Voice(pygame.mixer.Channel(index + i)) for i in range(size)]
+            index += size
+
+    def attenuation(self, position):
+        """
+        Volumen izquierdo y derecho (0 a 1) de un sonido emitido en ``position``.
+
+        Cae linealmente con la distancia al oyente y se panea según la
+        diferencia horizontal.
+        """
+        if position is None or self.listener is None:
+            return 1.0, 1.0
+        dx = position[0] - self.listener[0]
+        dy = position[1] - self.listener[1]
+        distance = (dx * dx + dy * dy) ** 0.5
+        gain = max(0.0, 1.0 - distance / self.hearing_radius)
+        pan = max(-1.0, min(1.0, dx / self.hearing_radius))  # -1 = izquierda, 1 = derecha
+        return gain * min(1.0, 1.0 - pan), gain * min(1.0, 1.0 + pan)
+
+    def nearest(self, positions):
+        """Devuelve la posición de ``positions`` más cercana al oyente (o la primera si no hay oyente)."""
+        if self.listener is None:
+            return positions[0]
+        x, y = self.listener
+        return min(positions, key=lambda p: (p[0] - x) ** 2 + (p[1] - y) ** 2)
+
+    def can_play(self, event, now=None):
+        """Indica si ``event`` ya cumplió su intervalo mínimo (para no preparar sonidos que se descartarían)."""
+        last = self._last_played.get(event)
+        if last is None:
+            return True
+        now = pygame.time.get_ticks() if now is None else now
+        return now - last >= self.events[event][3]
+
+    def play(self, event, position=None, now=None):
+        """
+        Reproduce ``event`` si el límite de frecuencia, la distancia y el grupo de canales lo permiten.
+
+        Args:
+            event (str): Clave de ``EVENTS``.
+            position (tuple): Punto del mundo donde se origina el sonido, o None (sin atenuación).
+            now (int): Milisegundos actuales; por defecto ``pygame.time.get_ticks()``.
+
+        Returns:
+            pygame.mixer.Channel: El canal usado, o None si el sonido se descartó.
+        """
+        if self.muted or not pygame.mixer.get_init():
+            return None
+        path, category, base_volume, _ = self.events[event]
+        now = pygame.time.get_ticks() if now is None else now
+
+        # Límite de frecuencia por evento
+        if not self.can_play(event, now):
+            self.stats["throttled"] += 1
+            return None
+
+        left, right = self.attenuation(position)
+        volume = base_volume * max(left, right)
+        if volume <= 0.0:
+            self.stats["culled"] += 1  # Demasiado lejos para oírse
+            return None
+
+        if self._voices is None:
+            self._reserve_channels()
+        voices = self._voices[category]
+        voice = next((voice for voice in voices if not voice.channel.get_busy()), None)
+        if voice is None:
+            # Robo de voz: reemplazar la más baja del grupo, solo si el sonido nuevo es más fuerte
+            voice = min(voices, key=lambda voice: voice.volume)
+            if voice.volume >= volume:
+                self.stats["dropped"] += 1
+                return None
+            self.stats["stolen"] += 1
+
+        voice.channel.play(load_sound(path))
+        voice.channel.set_volume(base_volume * left, base_volume * right)
+        voice.volume = volume
+        self._last_played[event] = now
+        self.stats["played"] += 1
+        return voice.channel
+
+    def stop(self):
+        """Detiene todas las voces administradas."""
+        for voices in (self._voices or {}).values():
+            for voice in voices:
+                voice.channel.stop()
+
+
+# Instancia compartida por Player, Enemy y EnemySwarm
+voices = VoiceManager()
+
+
+def play_sound(event, position=None):
+    """Atajo a ``voices.play``."""
+    return voices.play(event, position)
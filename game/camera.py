@@ -0,0 +1,34 @@
+# game/camera.py
+import pygame
+
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class Camera:
+    """Ventana visible del nivel que sigue al jugador sin salirse del mundo."""
+
+    def __init__(self, world_size, view_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        """
+        Inicializa la cámara.
+
+        Args:
+            world_size (tuple): Ancho y alto del nivel en píxeles (ver ``Level.pixel_size``).
+            view_size (tuple): Ancho y alto de la ventana visible.
+        """
+        self.rect = pygame.Rect((0, 0), view_size)
+        self.world_width, self.world_height = world_size
+
+    @property
+    def offset(self):
+        """Esquina superior izquierda de la ventana en coordenadas del mundo."""
+        return self.rect.topleft
+
+    def follow(self, target):
+        """Centra la cámara en ``target`` (un ``pygame.Rect``), limitada a los bordes del mundo."""
+        self.rect.center = target.center
+        self.rect.left = max(0, min(self.rect.left, self.world_width - self.rect.width))
+        self.rect.top = max(0, min(self.rect.top, self.world_height - self.rect.height))
+
+    def apply(self, position):
+        """Convierte una posición (x, y) del mundo a coordenadas de pantalla."""
+        return position[0] - self.rect.x, position[1] - self.rect.y
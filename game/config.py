@@ -2,6 +2,34 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+DIRTY_RECTS = False  # Actualizar solo las regiones que cambian (pantallas con render por software)
+MAX_DIRTY_RECTS = 64  # Con más regiones que estas se actualiza la pantalla completa
+TRANSITION_TIME = 0.4  # Duración de cada mitad de un fundido entre escenas (segundos)
+TICK_RATE = 60  # Pasos de simulación por segundo (las velocidades están en píxeles por paso)
+MAX_CATCH_UP_TICKS = 5  # Máximo de pasos recuperados tras un cuadro lento
+TILE_SIZE = 40  # Tamaño de cada celda del laberinto en píxeles
+CHUNK_TILES = 8  # Celdas por lado de cada bloque de render de niveles grandes
+CHUNK_CACHE_SIZE = 48  # Bloques compuestos que se mantienen en memoria
+NIGHT_COLOR = (0, 0, 64)  # Tinte nocturno (azul oscuro)
+NIGHT_OPACITY = 180  # Opacidad del tinte nocturno (0-255)
+DARKNESS_MODE = False  # Oscuridad con luz solo alrededor del jugador y la meta
+PLAYER_LIGHT_RADIUS = 140  # Radio de luz del jugador en modo oscuridad
+GOAL_LIGHT_RADIUS = 70  # Radio de luz de la meta en modo oscuridad
+FOG_OF_WAR = False  # Niebla sobre las celdas que el jugador no ve (las paredes bloquean la vista)
+FOV_RADIUS = 8  # Alcance de la vista en celdas
+FOG_OPACITY = 230  # Opacidad de la niebla (0-255)
+PLAYER_START = (38, 45)  # Posición inicial del jugador en píxeles (esquina superior izquierda)
+PLAYER_SIZE = (48, 64)  # Tamaño de cada cuadro del jugador (192/4 = 48, 256/4 = 64)
+PLAYER_COLLIDER_MARGIN = {"left": 10, "right": 10, "top": 30, "bottom": 0}  # Colisionador dentro del cuadro
+ENEMY_COUNT = 1  # Enemigos por nivel
+ENEMY_SIZE = 120  # Lado del sprite de los enemigos en píxeles
+ENEMY_SPAWN_DISTANCE = 6  # Pasos de camino mínimos entre el jugador y la aparición de cada enemigo
+ENEMY_CHASE = False  # Los enemigos persiguen al jugador por el laberinto en vez de vagar
+CHASE_RADIUS = 48  # Pasos de camino hasta los que los enemigos detectan y persiguen al jugador
+ASSET_BUDGET = 64 * 1024 * 1024  # Bytes de recursos cacheados (imágenes, sonidos) por proceso
+ASSET_BUDGET_POLICY = "evict"  # Al superar el presupuesto: "evict" (descartar por LRU) o "warn" (solo avisar)
+AUDIO_POOLS = {"player": 2, "enemy": 4}  # Canales reservados por categoría de sonido
+HEARING_RADIUS = 600  # Distancia (píxeles) a partir de la cual un sonido ya no se oye
 
 # Colores (RGB)
 WHITE = (255, 255, 255)
@@ -1,7 +1,7 @@
 import pygame
-import os
 import random
-from game.utils import resource_path
+from game.assets import load_frames
+from game.audio import play_sound
 
 class Enemy:
     def __init__(self, x, y, speed=2):
@@ -14,7 +14,7 @@ class Enemy:
             speed (int): Velocidad del enemigo.
         """
         # Cargar los cuadros del GIF
-        self.frames = self.load_frames(resource_path("assets/images/enemy_frames"), (120, 120))
+        self.frames = self.load_frames("assets/images/enemy_frames", (120, 120))
         self.current_frame = 0
         self.animation_speed = 100  # Milisegundos entre cuadros
         self.last_update = pygame.time.get_ticks()
@@ -27,19 +27,9 @@ class Enemy:
         # Margen personalizado para el colisionador
         self.collider_margin = {"left": 20, "right": 20, "top": 20, "bottom": 20}  # Márgenes ajustables
 
-        # Cargar el sonido de cambio de dirección
-        self.change_direction_sound = pygame.mixer.Sound(resource_path("assets/sounds/flying.wav"))
-        self.change_direction_sound.set_volume(0.5)  # Ajustar el volumen (opcional)
-
     def load_frames(self, folder, size):
-        """Carga los cuadros del GIF desde una carpeta."""
-        frames = []
-        for file in sorted(os.listdir(folder)):
-            if file.endswith(".png"):
-                frame = pygame.image.load(os.path.join(folder, file))
-                frame = pygame.transform.scale(frame, size)  # Ajustar el tamaño de los cuadros
-                frames.append(frame)
-        return frames
+        """Carga los cuadros del GIF desde una carpeta (compartidos a través de la caché de recursos)."""
+        return load_frames(folder, size)
 
     def animate(self):
         """Actualiza el cuadro actual para la animación."""
@@ -48,40 +38,59 @@ class Enemy:
             self.last_update = now
             self.current_frame = (self.current_frame + 1) % len(self.frames)
 
-    def move(self):
-        """Mueve al enemigo en una dirección aleatoria."""
+    def move(self, bounds=None, level=None):
+        """
+        Mueve al enemigo en una dirección aleatoria.
+
+        Args:
+            bounds (tuple): Ancho y alto del área en la que rebota. Por defecto, el tamaño de la pantalla.
+            level (Level): Si se indica, el enemigo también rebota contra las paredes (misma regla que
+                ``EnemySwarm.move``: la celda bajo el centro).
+        """
         previous_direction = self.direction.copy()
 
         # Cambiar dirección aleatoriamente
         if random.randint(0, 50) == 0:
             self.direction = [random.choice([-1, 0, 1]), random.choice([-1, 0, 1])]
             if self.direction != previous_direction:
-                self.change_direction_sound.play()
+                play_sound("flying", self.rect.center)
 
         # Actualizar posición
         self.rect.x += self.direction[0] * self.speed
         self.rect.y += self.direction[1] * self.speed
 
+        # Rebotar contra las paredes del nivel
+        if level is not None and level.is_wall(*level.cell_at(*self.rect.center)):
+            self.rect.x -= self.direction[0] * self.speed
+            self.rect.y -= self.direction[1] * self.speed
+            self.direction = [-self.direction[0], -self.direction[1]]
+            play_sound("flying", self.rect.center)
+
         # Mantener al enemigo dentro de los límites de la pantalla
-        screen_width = pygame.display.get_surface().get_width()
-        screen_height = pygame.display.get_surface().get_height()
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_size()
+        screen_width, screen_height = bounds
 
         if self.rect.left < 0:
             self.rect.left = 0
             self.direction[0] *= -1
-            self.change_direction_sound.play()
+            play_sound("flying", self.rect.center)
         if self.rect.right > screen_width:
             self.rect.right = screen_width
             self.direction[0] *= -1
-            self.change_direction_sound.play()
+            play_sound("flying", self.rect.center)
         if self.rect.top < 0:
             self.rect.top = 0
             self.direction[1] *= -1
-            self.change_direction_sound.play()
+            play_sound("flying", self.rect.center)
         if self.rect.bottom > screen_height:
             self.rect.bottom = screen_height
             self.direction[1] *= -1
-            self.change_direction_sound.play()
+            play_sound("flying", self.rect.center)
+
+    def collides(self, rect):
+        """Indica si el enemigo toca ``rect`` (misma interfaz que ``EnemySwarm.collides``)."""
+        return self.rect.colliderect(rect)
 
     def get_collider_rect(self):
         """
@@ -96,9 +105,14 @@ class Enemy:
             self.rect.height - margin["top"] - margin["bottom"]
         )
 
-    def render(self, screen):
-        """Renderiza al enemigo en la pantalla."""
+    def render(self, screen, position=None):
+        """
+        Renderiza al enemigo en la pantalla (en ``position`` si se indica, p. ej. interpolada).
+
+        Returns:
+            pygame.Rect: Área de la pantalla modificada.
+        """
         self.animate()
-        screen.blit(self.frames[self.current_frame], self.rect)
+        return screen.blit(self.frames[self.current_frame], self.rect if position is None else position)
 
         # pygame.draw.rect(screen, (255, 0, 0), self.get_collider_rect(), 1)
@@ -0,0 +1,225 @@
+# game/env.py
+"""
+Entorno programático del laberinto, al estilo de Gym/Gymnasium, sin ventana.
+
+    env = MazeEnv()
+    observation, info = env.reset(seed=0)
+    observation, reward, terminated, truncated, info = env.step(RIGHT)
+
+La observación es compacta: la rejilla de paredes del nivel (compartida,
+de solo lectura), la celda de la meta y las posiciones del jugador y de los
+enemigos. ``run_parallel`` reparte muchos episodios entre procesos y
+reporta los pasos por segundo totales, por ejemplo para estimar la
+dificultad de un nivel con agentes aleatorios:
+
+    python -m game.env --episodes 200 --workers 4
+    python -m game.env --level assets/levels/level2.txt --max-steps 5000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pygame
+
+from game.config import ENEMY_COUNT, ENEMY_CHASE
+from game.simulation import GAME_OVER, GOAL, Simulation, init_headless, pressed
+
+# Acciones: índice -> tecla presionada en ese paso
+IDLE, UP, DOWN, LEFT, RIGHT = range(5)
+ACTION_KEYS = [pressed(), pressed(pygame.K_UP), pressed(pygame.K_DOWN),
+               pressed(pygame.K_LEFT), pressed(pygame.K_RIGHT)]
+TRUNCATED = "truncated"
+
+# Recompensas por resultado del paso
+REWARDS = {GOAL: 1.0, GAME_OVER: -1.0, None: 0.0}
+
+
+class MazeEnv:
+    """Un nivel con su jugador y sus enemigos, manejado paso a paso."""
+
+    def __init__(self, level_file="assets/levels/level1.txt", enemy_count=ENEMY_COUNT, enemy_speed=3,
+                 max_steps=3000, initial_position=None, chase=ENEMY_CHASE):
+        """
+        Args:
+            level_file: Ruta de un nivel (texto o ``.lvl``) o una rejilla generada (ver ``Level``).
+            enemy_count (int): Enemigos por episodio.
+            enemy_speed (int): Velocidad de los enemigos (píxeles por paso).
+            max_steps (int): Pasos máximos antes de truncar el episodio.
+            initial_position (tuple): Posición inicial del jugador en píxeles; por defecto, la del nivel
+                (``Level.start_position``).
+            chase (bool): Si los enemigos persiguen al jugador con un ``FlowField``.
+        """
+        # Importaciones locales: Level y compañía necesitan pygame ya inicializado
+        from game.audio import voices
+        from game.level import Level
+        from game.maze import FlowField
+        from game.player import Player
+        from game.utils import resource_path
+
+        screen = pygame.display.get_surface() or init_headless()
+        voices.muted = True  # Sin sonido aunque haya mezclador
+        if isinstance(level_file, str):
+            level_file = resource_path(level_file)
+
+        self.level = Level(level_file, screen)
+        self.initial_position = initial_position or self.level.start_position()
+        self.player = Player(*self.initial_position)
+        self.enemy_count = enemy_count
+        self.enemy_speed = enemy_speed
+        self.max_steps = max_steps
+        self.flow_field = FlowField(self.level) if chase else None
+        self.action_count = len(ACTION_KEYS)
+        self.simulation = None
+        self.enemies = None
+
+        # Partes fijas de la observación
+        grid = np.frombuffer(self.level.grid, dtype=np.uint8).reshape(self.level.rows, self.level.cols)
+        self.grid = grid.view()
+        self.grid.flags.writeable = False
+        goal = self.level.goal
+        self.goal_cell = np.array(self.level.cell_at(*goal.center) if goal else (-1, -1), dtype=np.int32)
+
+    def reset(self, seed=None):
+        """
+        Empieza un episodio.
+
+        Args:
+            seed (int): Semilla de las posiciones y el movimiento de los enemigos.
+
+        Returns:
+            tuple: ``(observación, info)``.
+        """
+        from game.scenes import create_enemies  # game.scenes importa casi todo el juego
+
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.player.rect.topleft = self.initial_position
+        self.enemies = create_enemies(self.player.rect, *self.level.pixel_size(), count=self.enemy_count,
+                                      speed=self.enemy_speed, seed=seed, level=self.level)
+        self.simulation = Simulation(self.level, self.player, self.enemies, flow_field=self.flow_field)
+        return self.observation(), {"seed": seed}
+
+    def step(self, action):
+        """
+        Avanza un paso de simulación con ``action`` (``IDLE``, ``UP``, ``DOWN``, ``LEFT`` o ``RIGHT``).
+
+        Returns:
+            tuple: ``(observación, recompensa, terminado, truncado, info)``.
+        """
+        result = self.simulation.step(ACTION_KEYS[action])
+        terminated = result is not None
+        truncated = not terminated and self.simulation.ticks >= self.max_steps
+        info = {"result": TRUNCATED if truncated else result, "steps": self.simulation.ticks}
+        return self.observation(), REWARDS[result], terminated, truncated, info
+
+    def observation(self):
+        """
+        Estado compacto del episodio.
+
+        Returns:
+            dict: ``grid`` (filas x columnas, 1 = pared), ``goal`` (celda), ``player``
+            (píxeles, esquina superior izquierda), ``player_cell`` y ``enemies`` (N x 2, píxeles).
+        """
+        player = self.player.rect
+        return {
+            "grid": self.grid,
+            "goal": self.goal_cell,
+            "player": np.array(player.topleft, dtype=np.int32),
+            "player_cell": np.array(self.level.cell_at(*self.player.get_collider_rect().center), dtype=np.int32),
+            "enemies": self.enemies.positions.astype(np.int32),
+        }
+
+
+def random_policy(observation, rng):
+    """Política de referencia: una dirección al azar (``run_episode`` la repite varios pasos)."""
+    return rng.integers(1, 5)
+
+
+# Entorno de cada proceso del pool (se crea una vez por proceso)
+_worker_env = None
+
+
+def _init_worker(env_kwargs):
+    global _worker_env
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    _worker_env = MazeEnv(**env_kwargs)
+
+
+def run_episode(seed, env=None, policy=random_policy, repeat=8):
+    """
+    Ejecuta un episodio completo.
+
+    Args:
+        seed (int): Semilla del episodio (enemigos y política).
+        env (MazeEnv): Entorno; por defecto, el del proceso actual del pool.
+        policy: Función ``policy(observación, rng) -> acción``.
+        repeat (int): Pasos que se repite cada acción elegida.
+
+    Returns:
+        tuple: ``(semilla, pasos, resultado)``.
+    """
+    env = env or _worker_env
+    rng = np.random.default_rng(seed)
+    observation, _ = env.reset(seed)
+    action = IDLE
+    while True:
+        if env.simulation.ticks % repeat == 0:
+            action = policy(observation, rng)
+        observation, _, terminated, truncated, info = env.step(action)
+        if terminated or truncated:
+            return seed, info["steps"], info["result"]
+
+
+def run_parallel(episodes, workers=None, seed=0, **env_kwargs):
+    """
+    Reparte ``episodes`` episodios entre un pool de procesos.
+
+    Args:
+        episodes (int): Cantidad de episodios.
+        workers (int): Procesos; por defecto, uno por CPU.
+        seed (int): Semilla base (el episodio ``i`` usa ``seed + i``).
+        **env_kwargs: Argumentos de ``MazeEnv``.
+
+    Returns:
+        dict: Resultados por episodio, conteo por resultado, pasos totales, segundos y pasos/s.
+    """
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(env_kwargs,)) as pool:
+        chunk = max(1, episodes // (4 * (workers or os.cpu_count() or 1)))
+        results = list(pool.map(run_episode, range(seed, seed + episodes), chunksize=chunk))
+    elapsed = time.perf_counter() - start
+
+    steps = sum(result[1] for result in results)
+    outcomes = {}
+    for _, _, outcome in results:
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return {"episodes": results, "outcomes": outcomes, "steps": steps,
+            "seconds": elapsed, "steps_per_second": steps / elapsed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Episodios en paralelo con una política aleatoria")
+    parser.add_argument("--episodes", type=int, default=64)
+    parser.add_argument("--workers", type=int, help="procesos (por defecto, uno por CPU)")
+    parser.add_argument("--level", default="assets/levels/level1.txt")
+    parser.add_argument("--enemies", type=int, default=ENEMY_COUNT)
+    parser.add_argument("--max-steps", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    summary = run_parallel(args.episodes, args.workers, args.seed, level_file=args.level,
+                           enemy_count=args.enemies, max_steps=args.max_steps)
+    print(f"{args.episodes} episodios, {summary['steps']:,} pasos en {summary['seconds']:.2f} s "
+          f"({summary['steps_per_second']:,.0f} pasos/s)")
+    for outcome, count in sorted(summary["outcomes"].items()):
+        print(f"  {outcome}: {count} ({count / args.episodes:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,56 @@
 import pygame
-from game.config import WHITE, BLACK, SCREEN_WIDTH, SCREEN_HEIGHT
+import numpy as np
+from collections import OrderedDict
+from game.config import (
+    WHITE, BLACK, SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, CHUNK_TILES, CHUNK_CACHE_SIZE, PLAYER_START,
+)
+from game.assets import load_image
+from game.levelcompiler import CompiledLevel, compile_level, merge_walls, player_position
+from game.levelfile import LEVEL_EXTENSION, read_level
+from game.maze import SpawnIndex
 from game.utils import resource_path
 
 class Level:
     def __init__(self, level_file, screen):
         self.screen = screen
-        self.tiles = []  # Matriz de paredes (rectángulos)
-        self.sprites = []  # Matriz de sprites correspondientes a las paredes
+        self._tiles = None  # Matriz de paredes (rectángulos), construida bajo demanda
+        self._sprites = None  # Matriz de sprites correspondientes a las paredes
+        self._wall_rects = {}  # (cx, cy) -> paredes fusionadas de ese bloque (ver wall_rects)
+        self._spawn_indexes = {}  # (origen, margen, separación) -> SpawnIndex
         self.goal = None  # Coordenadas de la meta
+        self.spawn = None  # Celda de aparición del jugador, si el archivo la define
+
+        # Rejilla de ocupación: un byte por celda (1 = pared), indexada por fila * cols + columna
+        self.grid = bytearray()
+        self.cols = 0
+        self.rows = 0
+
+        # Superficie estática (piso + paredes) compuesta una sola vez por nivel
+        self.static_surface = None
+
+        # Niveles más grandes que la pantalla: bloques compuestos bajo demanda (LRU)
+        self.chunks = OrderedDict()  # (cx, cy) -> pygame.Surface
 
         # Cargar el fondo (piso)
-        self.floor_sprite = pygame.image.load(resource_path("assets/autotiles/Chão (4).png"))
+        self.floor_sprite = load_image("assets/autotiles/Chão (4).png")
         self.floor_width, self.floor_height = self.floor_sprite.get_size()
 
         # Cargar el spritesheet de paredes
-        self.tree_spritesheet = pygame.image.load(resource_path("assets/images/Object tree 2.png"))  # Cargar spritesheet
+        self.tree_spritesheet_path = "assets/images/Object tree 2.PNG"
+        self.tree_spritesheet = load_image(self.tree_spritesheet_path)  # Cargar spritesheet
         self.tree_sprites = self.load_spritesheet(128, 128, 4, 4)  # Dividir spritesheet en 16 cuadros
-        self.load_level(level_file)
+
+        # Un archivo de texto, uno binario (.lvl), un nivel ya compilado (por ejemplo, por
+        # game.levelstream) o una rejilla ya generada (por ejemplo, game.maze.generate_maze)
+        if isinstance(level_file, CompiledLevel):
+            self.load_compiled(level_file)
+        elif hasattr(level_file, "grid"):
+            self.load_grid(level_file.cols, level_file.rows, level_file.grid, level_file.goal,
+                           getattr(level_file, "spawn", None))
+        elif level_file.endswith(LEVEL_EXTENSION):
+            self.load_binary(level_file)
+        else:
+            self.load_level(level_file)
 
     def load_spritesheet(self, width, height, rows, cols):
         """Divide el spritesheet en una lista de cuadros por filas y columnas."""
@@ -26,48 +60,274 @@ class Level:
 
         for row in range(rows):
             for col in range(cols):
-                frame = self.tree_spritesheet.subsurface(pygame.Rect(
+                # Recorte escalado a 40x40, compartido entre niveles por la caché de recursos
+                frame = load_image(self.tree_spritesheet_path, size=(40, 40), area=(
                     col * frame_width, row * frame_height, frame_width, frame_height
                 ))
-                frame = pygame.transform.scale(frame, (40, 40))  # Escalar cada cuadro a 40x40
                 frames.append(frame)
         return frames
 
     def load_level(self, level_file):
-        """Carga el nivel desde un archivo de texto."""
-        with open(level_file, "r") as file:
-            for y, line in enumerate(file):
-                row_tiles = []
-                row_sprites = []
-                for x, char in enumerate(line.strip()):
-                    if char == "1":  # Pared
-                        # Crear un rectángulo para la colisión
-                        row_tiles.append(pygame.Rect(x * 40, y * 40, 40, 40))
-                        # Seleccionar un sprite del spritesheet de manera aleatoria
-                        sprite_index = (x + y) % len(self.tree_sprites)  # Alternar sprites en base a la posición
-                        row_sprites.append(self.tree_sprites[sprite_index])
-                    elif char == "E":  # Meta
-                        self.goal = pygame.Rect(x * 40, y * 40, 40, 40)
-                self.tiles.append(row_tiles)
-                self.sprites.append(row_sprites)
+        """
+        Carga el nivel desde un archivo de texto, compilado y validado por ``game.levelcompiler``
+        (lanza ``LevelError`` si el nivel no es válido).
+        """
+        self.load_compiled(compile_level(resource_path(level_file)))
+
+    def load_compiled(self, maze):
+        """Carga un nivel compilado por ``game.levelcompiler`` (ya validado)."""
+        self.load_grid(maze.cols, maze.rows, maze.grid, maze.goal, maze.spawn)
+
+    def load_binary(self, level_file):
+        """Carga el nivel desde un archivo binario (ver ``game.levelfile``)."""
+        maze = read_level(level_file)
+        self.load_grid(maze.cols, maze.rows, maze.grid, maze.goal, maze.spawn)
+
+    def load_grid(self, cols, rows, grid, goal=None, spawn=None):
+        """
+        Carga el nivel desde una rejilla de ocupación ya construida.
+
+        Los rectángulos y sprites de las paredes no se crean aquí: se
+        construyen bajo demanda (ver ``tiles`` y ``wall_rects``).
+
+        Args:
+            cols (int): Columnas de la rejilla.
+            rows (int): Filas de la rejilla.
+            grid (bytearray): Un byte por celda (1 = pared), fila por fila.
+            goal (tuple): Celda (col, row) de la meta, o None.
+            spawn (tuple): Celda (col, row) de aparición del jugador, o None.
+        """
+        self.cols = cols
+        self.rows = rows
+        self.grid = grid
+        self._tiles = None
+        self._sprites = None
+        self._wall_rects = {}
+        self._spawn_indexes = {}
+        self.spawn = spawn
+        self.goal = None
+        if goal is not None:
+            self.goal = pygame.Rect(goal[0] * TILE_SIZE, goal[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+        # El nivel cambió: descartar la superficie anterior y volver a componerla
+        self.invalidate()
+        if pygame.display.get_surface() is not None and self.fits_screen():
+            self.bake()
+
+    def sprite_at(self, col, row):
+        """Sprite de árbol de la pared en (col, row)."""
+        return self.tree_sprites[(col + row) % len(self.tree_sprites)]  # Alternar sprites en base a la posición
+
+    @property
+    def tiles(self):
+        """Matriz de rectángulos de las paredes, fila por fila (se construye la primera vez)."""
+        if self._tiles is None:
+            self._tiles = []
+            self._sprites = []
+            for y in range(self.rows):
+                offset = y * self.cols
+                columns = [x for x in range(self.cols) if self.grid[offset + x]]
+                self._tiles.append([pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE) for x in columns])
+                self._sprites.append([self.sprite_at(x, y) for x in columns])
+        return self._tiles
+
+    @property
+    def sprites(self):
+        """Matriz de sprites correspondiente a ``tiles``."""
+        if self._sprites is None:
+            self.tiles  # Construye ambas matrices
+        return self._sprites
+
+    def wall_rects(self, area):
+        """
+        Paredes que tocan ``area``, fusionadas en rectángulos.
+
+        Se construyen por bloques de ``CHUNK_TILES`` celdas solo para las
+        zonas que se consultan (``merge_walls`` sobre las celdas del bloque),
+        y quedan guardadas para las siguientes consultas.
+
+        Args:
+            area (pygame.Rect): Región del mundo en píxeles.
+        """
+        size = CHUNK_TILES * TILE_SIZE
+        rects = []
+        for cy in range(max(area.top, 0) // size, (area.bottom - 1) // size + 1):
+            for cx in range(max(area.left, 0) // size, (area.right - 1) // size + 1):
+                chunk = self._wall_rects.get((cx, cy))
+                if chunk is None:
+                    chunk = self._wall_rects[(cx, cy)] = self._merge_chunk(cx, cy)
+                rects.extend(rect for rect in chunk if rect.colliderect(area))
+        return rects
+
+    def _merge_chunk(self, cx, cy):
+        """Rectángulos (píxeles) de las paredes fusionadas del bloque (cx, cy)."""
+        left, top = cx * CHUNK_TILES, cy * CHUNK_TILES
+        right, bottom = min(left + CHUNK_TILES, self.cols), min(top + CHUNK_TILES, self.rows)
+        if left >= right or top >= bottom:
+            return []
+        cells = np.frombuffer(self.grid, dtype=np.uint8).reshape(self.rows, self.cols)[top:bottom, left:right]
+        return [pygame.Rect((left + x) * TILE_SIZE, (top + y) * TILE_SIZE, w * TILE_SIZE, h * TILE_SIZE)
+                for x, y, w, h in merge_walls(right - left, bottom - top, cells.tobytes()).tolist()]
+
+    def spawn_index(self, origin=None, margin=0, clearance=0):
+        """
+        Índice de celdas libres para sortear apariciones (ver ``SpawnIndex``), construido una vez por nivel.
+
+        Args:
+            origin (tuple): Celda desde la que se miden las distancias de camino (por ejemplo,
+                la del jugador al empezar), o None para no medirlas.
+            margin (int): Celdas junto a los bordes que no se usan.
+            clearance (int): Celdas alrededor de ``origin`` que no se usan.
+        """
+        key = (tuple(origin) if origin is not None else None, margin, clearance)
+        index = self._spawn_indexes.get(key)
+        if index is None:
+            index = self._spawn_indexes[key] = SpawnIndex(self, *key)
+        return index
+
+    def is_wall(self, col, row):
+        """Indica si la celda (col, row) es una pared. Fuera del mapa no hay paredes."""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.grid[row * self.cols + col] == 1
+        return False
+
+    def cell_at(self, x, y):
+        """Devuelve la celda (col, row) que contiene el punto en píxeles (x, y)."""
+        return int(x) // TILE_SIZE, int(y) // TILE_SIZE
+
+    def collides(self, rect):
+        """
+        Verifica si un rectángulo toca alguna pared.
+
+        Solo revisa las celdas que el rectángulo cubre, así que el costo no
+        depende del tamaño del laberinto.
+
+        Args:
+            rect (pygame.Rect): Rectángulo a comprobar (por ejemplo, el colisionador del jugador).
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        first_col = max(rect.left // TILE_SIZE, 0)
+        last_col = min((rect.right - 1) // TILE_SIZE, self.cols - 1)
+        first_row = max(rect.top // TILE_SIZE, 0)
+        last_row = min((rect.bottom - 1) // TILE_SIZE, self.rows - 1)
+
+        grid = self.grid
+        for row in range(first_row, last_row + 1):
+            offset = row * self.cols
+            for col in range(first_col, last_col + 1):
+                if grid[offset + col]:
+                    return True
+        return False
 
     def update(self):
         """Actualiza la lógica del nivel."""
         pass
 
-    def render(self):
-        """Renderiza el nivel en la pantalla."""
-        self.render_floor()  # Renderizar el fondo primero
-        for row_tiles, row_sprites in zip(self.tiles, self.sprites):
-            for tile, sprite in zip(row_tiles, row_sprites):
-                self.screen.blit(sprite, tile.topleft)
+    def invalidate(self):
+        """Descarta las superficies compuestas; se vuelven a componer en el próximo render."""
+        self.static_surface = None
+        self.chunks.clear()
+
+    def start_position(self):
+        """Posición inicial del jugador en píxeles: la de ``spawn`` si el nivel la define, si no ``PLAYER_START``."""
+        return player_position(self.spawn) if self.spawn is not None else PLAYER_START
+
+    def pixel_size(self):
+        """Tamaño del área jugable en píxeles (nunca menor que la pantalla)."""
+        return max(SCREEN_WIDTH, self.cols * TILE_SIZE), max(SCREEN_HEIGHT, self.rows * TILE_SIZE)
+
+    def fits_screen(self):
+        """Indica si el nivel completo cabe en la pantalla."""
+        return self.pixel_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def bake(self):
+        """Compone el piso y las paredes en una única superficie con el formato de la pantalla."""
+        surface = pygame.Surface(self.pixel_size())
+        self.render_floor(surface)
+        self.render_walls(surface)
+        self.static_surface = surface.convert()
+        return self.static_surface
+
+    def bake_chunk(self, cx, cy):
+        """Compone el bloque (cx, cy) de ``CHUNK_TILES`` x ``CHUNK_TILES`` celdas."""
+        size = CHUNK_TILES * TILE_SIZE
+        surface = pygame.Surface((size, size))
+        self.render_floor(surface, origin=(cx * size, cy * size))
+
+        first_col, first_row = cx * CHUNK_TILES, cy * CHUNK_TILES
+        self.render_walls(surface, first_col, first_row, CHUNK_TILES, CHUNK_TILES)
+        return surface.convert()
+
+    def chunk(self, cx, cy):
+        """Devuelve el bloque (cx, cy), componiéndolo la primera vez que se ve."""
+        key = (cx, cy)
+        surface = self.chunks.get(key)
+        if surface is None:
+            surface = self.chunks[key] = self.bake_chunk(cx, cy)
+            if len(self.chunks) > CHUNK_CACHE_SIZE:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return surface
+
+    def render(self, camera=None):
+        """
+        Renderiza el nivel en la pantalla.
+
+        Args:
+            camera (Camera): Ventana visible. Sin cámara se dibuja el nivel completo desde (0, 0).
+        """
+        if camera is None or (self.fits_screen() and camera.offset == (0, 0)):
+            if self.static_surface is None:
+                self.bake()
+            self.screen.blit(self.static_surface, (0, 0))
+        else:
+            self.render_chunks(camera)
 
         # # Dibujar la meta sin resplandor
         # if self.goal:
         #     pygame.draw.rect(self.screen, (0, 255, 0), self.goal)  # Meta en verde (puedes ajustar el color o quitar esto)
 
-    def render_floor(self):
-        """Renderiza el piso del laberinto repitiendo el sprite en mosaico."""
-        for y in range(0, SCREEN_HEIGHT, self.floor_height):
-            for x in range(0, SCREEN_WIDTH, self.floor_width):
-                self.screen.blit(self.floor_sprite, (x, y))
+    def render_chunks(self, camera):
+        """Dibuja solo los bloques que se superponen con la ventana de la cámara."""
+        size = CHUNK_TILES * TILE_SIZE
+        view = camera.rect
+        for cy in range(view.top // size, (view.bottom - 1) // size + 1):
+            for cx in range(view.left // size, (view.right - 1) // size + 1):
+                self.screen.blit(self.chunk(cx, cy), (cx * size - view.left, cy * size - view.top))
+
+    def render_walls(self, surface, first_col=0, first_row=0, cols=None, rows=None):
+        """
+        Dibuja los sprites de las paredes sobre la superficie indicada.
+
+        Args:
+            surface (pygame.Surface): Superficie destino; su esquina corresponde a la celda (first_col, first_row).
+            first_col (int): Primera columna a dibujar.
+            first_row (int): Primera fila a dibujar.
+            cols (int): Cantidad de columnas (por defecto, hasta el final del nivel).
+            rows (int): Cantidad de filas (por defecto, hasta el final del nivel).
+        """
+        last_col = self.cols if cols is None else min(first_col + cols, self.cols)
+        last_row = self.rows if rows is None else min(first_row + rows, self.rows)
+        grid = self.grid
+        for y in range(first_row, last_row):
+            offset = y * self.cols
+            for x in range(first_col, last_col):
+                if grid[offset + x]:
+                    surface.blit(self.sprite_at(x, y), ((x - first_col) * TILE_SIZE, (y - first_row) * TILE_SIZE))
+
+    def render_floor(self, surface, origin=(0, 0)):
+        """
+        Renderiza el piso del laberinto repitiendo el sprite en mosaico.
+
+        Args:
+            surface (pygame.Surface): Superficie destino.
+            origin (tuple): Posición de la superficie en el mundo, para alinear el mosaico.
+        """
+        width, height = surface.get_size()
+        start_x = -(origin[0] % self.floor_width)
+        start_y = -(origin[1] % self.floor_height)
+        for y in range(start_y, height, self.floor_height):
+            for x in range(start_x, width, self.floor_width):
+                surface.blit(self.floor_sprite, (x, y))
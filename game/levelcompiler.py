@@ -0,0 +1,295 @@
+# game/levelcompiler.py
+"""
+Compilador de niveles de texto.
+
+Compilar un nivel:
+
+1. Normaliza el ancho de las filas (todas al ancho más frecuente: las cortas
+   se completan con paredes y a las largas se les recorta el sobrante) y
+   rechaza caracteres desconocidos.
+2. Verifica que cada meta ``E`` sea alcanzable desde la aparición del jugador.
+3. Fusiona las paredes en rectángulos alineados a la rejilla: cada tramo
+   horizontal de paredes se extiende hacia abajo mientras la fila siguiente
+   tenga exactamente el mismo tramo (algoritmo voraz; no siempre es el mínimo
+   absoluto, pero en estos laberintos queda cerca).
+
+El resultado se guarda junto al archivo fuente (``nivel.txt.compiled.npz``)
+y se reutiliza mientras el contenido del fuente no cambie. Los avisos de la
+normalización (filas completadas o recortadas) se emiten como ``LevelWarning``
+cada vez que el fuente se compila.
+
+Uso (desde la raíz del repositorio):
+    python -m game.levelcompiler assets/levels/level1.txt assets/levels/level2.txt
+"""
+import contextlib
+import os
+import sys
+import tempfile
+import warnings
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from game.config import TILE_SIZE, PLAYER_START, PLAYER_SIZE, PLAYER_COLLIDER_MARGIN
+from game.maze import UNREACHABLE, Grid, distance_field
+
+COMPILED_SUFFIX = ".compiled.npz"
+COMPILER_VERSION = 3  # 2: sin avisos guardados; 3: sin celda de aparición (el texto no la define)
+WALL, FLOOR, GOAL = "1", "0", "E"
+CELL_VALUES = bytes.maketrans(b"01E", b"\x00\x01\x00")  # Carácter -> byte de la rejilla
+
+# Aparición por defecto y colisionador de Player (x, y, ancho, alto relativos a su esquina)
+DEFAULT_SPAWN_POSITION = PLAYER_START
+PLAYER_COLLIDER = (
+    PLAYER_COLLIDER_MARGIN["left"],
+    PLAYER_COLLIDER_MARGIN["top"],
+    PLAYER_SIZE[0] - PLAYER_COLLIDER_MARGIN["left"] - PLAYER_COLLIDER_MARGIN["right"],
+    PLAYER_SIZE[1] - PLAYER_COLLIDER_MARGIN["top"] - PLAYER_COLLIDER_MARGIN["bottom"],
+)
+
+# Niveles ya compilados en este proceso: (ruta, aparición) -> (mtime_ns, tamaño, CompiledLevel)
+_compiled = {}
+
+
+class LevelError(ValueError):
+    """Nivel inválido: caracteres desconocidos, sin meta o con metas inalcanzables."""
+
+
+class LevelWarning(UserWarning):
+    """Nivel corregido al compilarse (por ejemplo, filas de distinto ancho)."""
+
+
+class CompiledLevel(Grid):
+    """
+    ``Grid`` con todas las metas y los rectángulos de colisión fusionados.
+
+    Los niveles de texto no definen aparición: ``spawn`` queda en None y el
+    jugador empieza en ``PLAYER_START`` (la posición que valida el compilador).
+    """
+
+    def __init__(self, cols, rows, grid, goals, spawn, rects):
+        super().__init__(cols, rows, grid, goals[-1] if goals else None, spawn)  # Como parse_text: la última meta
+        self.goals = goals
+        self.rects = rects  # numpy.ndarray (K, 4): col, fila, ancho y alto en celdas
+
+
+def normalize_rows(lines):
+    """
+    Lleva todas las filas al ancho más frecuente.
+
+    Returns:
+        tuple: ``(filas, avisos)``; cada aviso describe una fila completada o recortada.
+    """
+    lines = [line.strip() for line in lines]
+    while lines and not lines[-1]:
+        lines.pop()  # Líneas vacías al final del archivo
+    if not lines:
+        raise LevelError("el nivel está vacío")
+
+    width = Counter(len(line) for line in lines).most_common(1)[0][0]
+    notes = []
+    normalized = []
+    for y, line in enumerate(lines):
+        unknown = set(line) - {WALL, FLOOR, GOAL}
+        if unknown:
+            raise LevelError(f"fila {y}: caracteres desconocidos {sorted(unknown)}")
+        if len(line) < width:
+            notes.append(f"fila {y}: {len(line)} columnas, se completa con paredes hasta {width}")
+            line = line + WALL * (width - len(line))
+        elif len(line) > width:
+            notes.append(f"fila {y}: {len(line)} columnas, se recortan las {len(line) - width} sobrantes")
+            line = line[:width]
+        normalized.append(line)
+    return normalized, notes
+
+
+def merge_walls(cols, rows, grid):
+    """
+    Fusiona las paredes de la rejilla en rectángulos.
+
+    Returns:
+        numpy.ndarray: Arreglo int32 (K, 4) con col, fila, ancho y alto (en celdas) de cada rectángulo.
+    """
+    if not cols or not rows:
+        return np.zeros((0, 4), dtype=np.int32)
+    walls = np.frombuffer(bytes(grid), dtype=np.uint8).reshape(rows, cols)
+    padded = np.zeros((rows, cols + 2), dtype=np.int8)
+    padded[:, 1:-1] = walls
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)  # Orden por fila y luego por columna
+    _, run_ends = np.nonzero(edges == -1)
+    bounds = np.searchsorted(run_rows, np.arange(rows + 1)).tolist()
+    starts, ends = run_starts.tolist(), run_ends.tolist()
+
+    rects = []
+    open_rects = {}  # (inicio, fin) de un tramo -> rectángulo que llega hasta la fila anterior
+    for row in range(rows):
+        current = {}
+        for i in range(bounds[row], bounds[row + 1]):
+            key = (starts[i], ends[i])
+            rect = open_rects.pop(key, None)
+            if rect is None:
+                rect = [key[0], row, key[1] - key[0], 0]
+            rect[3] += 1
+            current[key] = rect
+        rects.extend(open_rects.values())  # Los tramos que no continúan en esta fila quedan cerrados
+        open_rects = current
+    rects.extend(open_rects.values())
+    return np.array(rects, dtype=np.int32).reshape(-1, 4)
+
+
+def spawn_cells(maze, position=DEFAULT_SPAWN_POSITION):
+    """Celdas libres que cubre el colisionador del jugador en ``position`` (píxeles)."""
+    x, y, width, height = PLAYER_COLLIDER
+    left, top = position[0] + x, position[1] + y
+    cells = []
+    for row in range(top // TILE_SIZE, (top + height - 1) // TILE_SIZE + 1):
+        for col in range(left // TILE_SIZE, (left + width - 1) // TILE_SIZE + 1):
+            if 0 <= col < maze.cols and 0 <= row < maze.rows and not maze.grid[row * maze.cols + col]:
+                cells.append((col, row))
+    return cells
+
+
+def player_position(cell):
+    """Posición del jugador (píxeles) con su colisionador centrado en ``cell``; inversa de ``spawn_cells``."""
+    x, y, width, height = PLAYER_COLLIDER
+    return (cell[0] * TILE_SIZE + (TILE_SIZE - width) // 2 - x,
+            cell[1] * TILE_SIZE + (TILE_SIZE - height) // 2 - y)
+
+
+def check_reachable(maze, spawn, goals):
+    """
+    Verifica que cada meta sea alcanzable desde alguna celda de ``spawn``.
+
+    Raises:
+        LevelError: Si la aparición cae dentro de una pared o alguna meta no tiene camino.
+    """
+    if not spawn:
+        raise LevelError("la aparición del jugador está dentro de una pared")
+    unreachable = []
+    for goal in goals:
+        distances = distance_field(maze, goal)
+        if all(distances[row, col] == UNREACHABLE for col, row in spawn):
+            unreachable.append(goal)
+    if unreachable:
+        raise LevelError(f"metas inalcanzables desde la aparición {spawn}: {unreachable}")
+
+
+def compile_text(lines, spawn_position=DEFAULT_SPAWN_POSITION, source="nivel"):
+    """
+    Compila las líneas de un nivel de texto.
+
+    Args:
+        lines: Líneas del archivo (``1`` pared, ``0`` piso, ``E`` meta).
+        spawn_position (tuple): Posición inicial del jugador en píxeles.
+        source (str): Nombre del nivel en los avisos (por ejemplo, su ruta).
+
+    Returns:
+        CompiledLevel: Nivel validado con sus rectángulos de colisión.
+
+    Raises:
+        LevelError: Si el nivel no es válido.
+    """
+    lines, notes = normalize_rows(lines)
+    for note in notes:
+        warnings.warn(f"{source}: {note}", LevelWarning, stacklevel=2)
+    rows, cols = len(lines), len(lines[0])
+    grid = bytearray("".join(lines).encode("ascii").translate(CELL_VALUES))
+    goals = [(x, y) for y, line in enumerate(lines) for x, char in enumerate(line) if char == GOAL]
+    if not goals:
+        raise LevelError("el nivel no tiene meta (E)")
+
+    maze = Grid(cols, rows, grid)
+    spawn = spawn_cells(maze, spawn_position)
+    check_reachable(maze, spawn, goals)
+    return CompiledLevel(cols, rows, grid, goals, None, merge_walls(cols, rows, grid))
+
+
+def compiled_path(path):
+    """Ruta del resultado compilado de ``path`` (junto al archivo fuente)."""
+    return path + COMPILED_SUFFIX
+
+
+def _load_cached(path, checksum):
+    try:
+        with np.load(compiled_path(path)) as data:
+            if int(data["version"]) != COMPILER_VERSION or int(data["checksum"]) != checksum:
+                return None
+            cols, rows = (int(value) for value in data["size"])
+            grid = bytearray(np.unpackbits(data["walls"], count=cols * rows).tobytes())
+            goals = [tuple(goal) for goal in data["goals"].tolist()]
+            return CompiledLevel(cols, rows, grid, goals, None, data["rects"])
+    except Exception:
+        return None  # Sin caché, de otra versión o dañada (truncada, vacía...): se vuelve a compilar
+
+
+def _save_cached(path, checksum, level):
+    # Se escribe en un temporal de la misma carpeta y se reemplaza de una vez: un corte o una
+    # escritura simultánea (hilos de precarga) nunca deja un .npz a medias
+    target = compiled_path(path)
+    try:
+        descriptor, temporary = tempfile.mkstemp(prefix=os.path.basename(target), suffix=".tmp",
+                                                 dir=os.path.dirname(target) or ".")
+    except OSError:
+        return  # Carpeta de solo lectura (por ejemplo, dentro del ejecutable): seguir sin caché
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            np.savez(file, version=COMPILER_VERSION, checksum=checksum, size=(level.cols, level.rows),
+                     walls=np.packbits(np.frombuffer(bytes(level.grid), dtype=np.uint8)),
+                     goals=np.array(level.goals, dtype=np.int32), rects=level.rects)
+        os.replace(temporary, target)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temporary)
+
+
+def compile_level(path, spawn_position=DEFAULT_SPAWN_POSITION):
+    """
+    Devuelve el nivel compilado de ``path``, usando la caché en memoria o en disco si el fuente no cambió.
+
+    Ambas cachés dependen también de ``spawn_position``: con otra aparición se
+    vuelve a verificar que las metas sean alcanzables.
+
+    Raises:
+        LevelError: Si el nivel no es válido (el mensaje incluye la ruta).
+    """
+    spawn_position = tuple(spawn_position)
+    stat = os.stat(path)
+    memo = _compiled.get((path, spawn_position))
+    if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+        return memo[2]
+
+    with open(path, "rb") as file:
+        source = file.read()
+    checksum = zlib.crc32(source) ^ zlib.crc32(repr(spawn_position).encode())
+    level = _load_cached(path, checksum)
+    if level is None:
+        try:
+            level = compile_text(source.decode("ascii", errors="replace").splitlines(), spawn_position, path)
+        except LevelError as error:
+            raise LevelError(f"{path}: {error}") from None
+        _save_cached(path, checksum, level)
+    _compiled[(path, spawn_position)] = (stat.st_mtime_ns, stat.st_size, level)
+    return level
+
+
+def main(paths):
+    failed = 0
+    for path in paths:
+        try:
+            level = compile_level(path)
+        except LevelError as error:
+            print(f"ERROR {error}")
+            failed += 1
+            continue
+        walls = sum(level.grid)
+        print(f"{path}: {level.cols}x{level.rows}, {walls} paredes -> {len(level.rects)} rectángulos, "
+              f"{len(level.goals)} meta(s) alcanzable(s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("Uso: python -m game.levelcompiler <nivel.txt> [...]")
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,97 @@
+# game/levelfile.py
+"""
+Formato binario compacto de niveles (``.lvl``).
+
+Estructura (little-endian):
+
+    cabecera (32 bytes): magic "LABY", versión (u16), flags (u16),
+                         columnas (u32), filas (u32),
+                         meta col/fila (i32, i32), aparición col/fila (i32, i32)
+    paredes:             un bit por celda (1 = pared), fila por fila, MSB primero
+
+Una coordenada -1 indica que el nivel no define meta o aparición.
+
+Conversión desde texto (desde la raíz del repositorio):
+    python -m game.levelfile assets/levels/level1.txt assets/levels/level1.lvl
+"""
+import mmap
+import struct
+import sys
+
+import numpy as np
+
+from game.maze import Grid
+
+LEVEL_EXTENSION = ".lvl"
+MAGIC = b"LABY"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIiiii")
+
+
+def parse_text(lines):
+    """Convierte las líneas de un nivel de texto en un ``Grid`` (``1`` pared, ``E`` meta)."""
+    rows = len(lines)
+    cols = max((len(line) for line in lines), default=0)
+    grid = bytearray(cols * rows)
+    goal = None
+    for y, line in enumerate(lines):
+        for x, char in enumerate(line):
+            if char == "1":  # Pared
+                grid[y * cols + x] = 1
+            elif char == "E":  # Meta
+                goal = (x, y)
+    return Grid(cols, rows, grid, goal)
+
+
+def write_binary(maze, path):
+    """Escribe un ``Grid`` en formato binario."""
+    goal = maze.goal if maze.goal is not None else (-1, -1)
+    spawn = maze.spawn if maze.spawn is not None else (-1, -1)
+    walls = np.frombuffer(bytes(maze.grid), dtype=np.uint8)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, maze.cols, maze.rows, *goal, *spawn))
+        file.write(np.packbits(walls).tobytes())
+
+
+def read_level(path):
+    """
+    Lee un nivel binario a través de ``mmap``.
+
+    La cabecera y el plano de bits se leen directamente del mapa de memoria,
+    sin copiarlos; la única copia es la expansión a un byte por celda que usa
+    ``Level.grid``.
+
+    Returns:
+        Grid: Rejilla con meta y aparición.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version, _, cols, rows, goal_col, goal_row, spawn_col, spawn_row = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} no es un nivel binario (magic {magic!r})")
+        if version != VERSION:
+            raise ValueError(f"{path}: versión {version} no soportada (se esperaba {VERSION})")
+
+        size = cols * rows
+        packed = np.frombuffer(data, dtype=np.uint8, count=(size + 7) // 8, offset=HEADER.size)
+        grid = bytearray(size)
+        np.frombuffer(grid, dtype=np.uint8)[:] = np.unpackbits(packed, count=size)
+        del packed  # Liberar la vista antes de cerrar el mmap
+
+    goal = (goal_col, goal_row) if goal_col >= 0 else None
+    spawn = (spawn_col, spawn_row) if spawn_col >= 0 else None
+    return Grid(cols, rows, grid, goal, spawn)
+
+
+def convert(text_path, binary_path, spawn=None):
+    """Convierte un nivel de texto al formato binario."""
+    with open(text_path, "r") as file:
+        maze = parse_text([line.strip() for line in file])
+    maze.spawn = spawn
+    write_binary(maze, binary_path)
+    return maze
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("Uso: python -m game.levelfile <nivel.txt> <nivel.lvl>")
+    convert(sys.argv[1], sys.argv[2])
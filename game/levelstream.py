@@ -0,0 +1,165 @@
+# game/levelstream.py
+"""
+Lista de niveles de una partida con precarga del siguiente nivel.
+
+Mientras se juega un nivel, un hilo lee y compila el siguiente
+(``game.levelcompiler`` o ``game.levelfile``): lectura del archivo,
+validación y fusión de paredes. Cuando termina, ``poll`` (llamado desde
+el hilo principal una vez por cuadro) arma el ``Level`` con la rejilla
+ya compilada: solo quedan aciertos de la caché de imágenes y la
+composición de la superficie estática, que necesita el formato de la
+pantalla. Al llegar a la meta, ``advance`` solo cambia el nivel actual
+por el ya preparado.
+
+La lista puede tener cualquier cantidad de niveles; las carpetas se
+expanden a sus niveles en orden alfabético (ver ``expand_playlist``).
+
+``close`` detiene el hilo (``GameScene.exit`` lo llama al dejar la partida,
+y también sirve como context manager); la siguiente precarga lo vuelve a
+crear.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from game.level import Level
+from game.levelcompiler import compile_level
+from game.levelfile import LEVEL_EXTENSION, read_level
+
+LEVEL_SUFFIXES = (".txt", LEVEL_EXTENSION)
+
+
+def expand_playlist(paths):
+    """
+    Expande carpetas a sus archivos de nivel (``.txt`` y ``.lvl``, en orden alfabético).
+
+    Args:
+        paths (list): Rutas de niveles o carpetas.
+
+    Returns:
+        list: Rutas de niveles, en orden.
+    """
+    levels = []
+    for path in paths:
+        if os.path.isdir(path):
+            levels += [os.path.join(path, name) for name in sorted(os.listdir(path))
+                       if name.endswith(LEVEL_SUFFIXES)]
+        else:
+            levels.append(path)
+    if not levels:
+        raise ValueError(f"no hay niveles en {paths}")
+    return levels
+
+
+def _compile(path):
+    """Trabajo del hilo: lee y compila un nivel (sin tocar pygame)."""
+    if path.endswith(LEVEL_EXTENSION):
+        return read_level(path)
+    return compile_level(path)
+
+
+class LevelStream:
+    """Nivel actual de una lista y el siguiente, preparado en segundo plano."""
+
+    def __init__(self, levels, screen):
+        """
+        Args:
+            levels (list): Rutas de los niveles, en orden (ya resueltas con ``resource_path``).
+            screen (pygame.Surface): Pantalla donde se dibujan los niveles.
+        """
+        if not levels:
+            raise ValueError("la lista de niveles está vacía")
+        self.levels = list(levels)
+        self.screen = screen
+        self.index = 0
+        self.level = None  # Level actual
+        self.executor = None  # Hilo de precarga, creado en la primera precarga (y de nuevo tras close)
+        self._pending = None  # (índice, future) de la compilación en curso
+        self._prepared = None  # (índice, Level) listo para el cambio
+        self.stats = {"prefetched": 0, "loaded": 0}  # Cambios instantáneos y cargas en el momento
+
+    def __len__(self):
+        return len(self.levels)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    @property
+    def next_index(self):
+        """Índice del nivel que sigue al actual (después del último vuelve al primero)."""
+        return (self.index + 1) % len(self.levels)
+
+    @property
+    def path(self):
+        """Ruta del nivel actual."""
+        return self.levels[self.index]
+
+    def current(self):
+        """Devuelve el nivel actual, cargándolo si todavía no existe, y empieza a precargar el siguiente."""
+        if self.level is None:
+            self.level = self._take(self.index)
+        self.prefetch()
+        return self.level
+
+    def prefetch(self):
+        """Empieza a compilar el siguiente nivel en el hilo, si no está ya en curso o listo."""
+        index = self.next_index
+        if index == self.index:
+            return  # Un único nivel: el siguiente es el mismo
+        if (self._prepared and self._prepared[0] == index) or (self._pending and self._pending[0] == index):
+            return
+        self._prepared = None
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="levelstream")
+        self._pending = (index, self.executor.submit(_compile, self.levels[index]))
+
+    def poll(self):
+        """
+        Arma el ``Level`` del siguiente nivel si su compilación ya terminó (hilo principal, una vez por cuadro).
+
+        Returns:
+            bool: Si el siguiente nivel está listo para ``advance``.
+        """
+        if self._pending is not None and self._pending[1].done():
+            index, future = self._pending
+            self._pending = None
+            self._prepared = (index, Level(future.result(), self.screen))
+        return self._prepared is not None
+
+    def _take(self, index):
+        """Devuelve el ``Level`` de ``index``: el preparado, el que se está compilando o uno nuevo."""
+        if self._prepared is not None and self._prepared[0] == index:
+            level, self._prepared = self._prepared[1], None
+            self.stats["prefetched"] += 1
+            return level
+        if self._pending is not None and self._pending[0] == index:
+            future, self._pending = self._pending[1], None
+            prepared = future.result()  # Todavía compilando: esperar solo lo que falta
+        else:
+            prepared = _compile(self.levels[index])
+        self.stats["loaded"] += 1
+        return Level(prepared, self.screen)
+
+    def advance(self):
+        """
+        Pasa al siguiente nivel.
+
+        Returns:
+            bool: False si se pasó del último nivel al primero (la lista terminó).
+        """
+        self.index = self.next_index
+        if len(self.levels) > 1:
+            self.level = self._take(self.index)
+        return self.index != 0
+
+    def close(self):
+        """Detiene el hilo de precarga; una compilación ya empezada termina y se usa igual."""
+        if self.executor is None:
+            return
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = None
+        if self._pending is not None and self._pending[1].cancelled():
+            self._pending = None
@@ -0,0 +1,99 @@
+# game/lighting.py
+from functools import lru_cache
+
+import numpy as np
+import pygame
+
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT, NIGHT_COLOR
+
+
+@lru_cache(maxsize=None)
+def night_overlay(size, opacity, color=NIGHT_COLOR):
+    """Filtro de noche de color sólido con alfa por superficie, creado una sola vez por tamaño y opacidad."""
+    overlay = pygame.Surface(size)
+    overlay.fill(color)
+    if pygame.display.get_surface() is not None:
+        overlay = overlay.convert()
+    overlay.set_alpha(opacity)  # Después de convert, que no conserva el alfa por superficie
+    return overlay
+
+
+@lru_cache(maxsize=None)
+def light_mask(radius, opacity):
+    """
+    Máscara radial que se resta del canal alfa de la oscuridad.
+
+    En el centro resta ``opacity`` (luz total) y se desvanece hasta 0 en el borde.
+    """
+    size = radius * 2
+    mask = pygame.Surface((size, size), pygame.SRCALPHA)
+    mask.fill((0, 0, 0, 0))
+    offsets = np.arange(size) - radius + 0.5
+    distance = np.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2) / radius
+    alpha = pygame.surfarray.pixels_alpha(mask)
+    alpha[:] = (opacity * np.clip(1 - distance ** 2, 0, 1)).astype(np.uint8)
+    del alpha  # Liberar el bloqueo de la superficie
+    return mask
+
+
+class Lighting:
+    """
+    Tinte nocturno y, en modo oscuridad, luces radiales alrededor del jugador y la meta.
+
+    Todas las superficies se crean una vez: el filtro de noche por opacidad y
+    las máscaras de luz por radio. Cada cuadro solo rellena la capa de
+    oscuridad, resta las máscaras con ``BLEND_RGBA_SUB`` y hace un blit.
+    """
+
+    def __init__(self, opacity=180, darkness=False, size=(SCREEN_WIDTH, SCREEN_HEIGHT), color=NIGHT_COLOR):
+        """
+        Inicializa la iluminación.
+
+        Args:
+            opacity (int): Opacidad del tinte (0-255).
+            darkness (bool): Activa las luces radiales (modo oscuridad).
+            size (tuple): Tamaño de la pantalla.
+            color (tuple): Color del tinte nocturno.
+        """
+        self.opacity = opacity
+        self.darkness = darkness
+        self.size = size
+        self.color = color
+        self.overlay = night_overlay(size, opacity, color)
+        self.darkness_layer = pygame.Surface(size, pygame.SRCALPHA) if darkness else None
+
+    def light_areas(self, lights):
+        """Rectángulos de pantalla que ocupan las luces (vacío fuera del modo oscuridad)."""
+        if not self.darkness:
+            return []
+        screen = pygame.Rect((0, 0), self.size)
+        return [pygame.Rect(x - radius, y - radius, radius * 2, radius * 2).clip(screen) for (x, y), radius in lights]
+
+    def render(self, screen, lights=(), areas=None, background=None):
+        """
+        Oscurece la pantalla.
+
+        Args:
+            screen (pygame.Surface): Superficie donde se renderiza el juego.
+            lights: Secuencia de ((x, y), radio) en coordenadas de pantalla; solo se usa en modo oscuridad.
+            areas (list): Si se indica, solo se oscurecen estos rectángulos de pantalla (rectángulos sucios).
+            background (pygame.Surface): Con ``areas``, fondo que se copia en cada área antes de
+                oscurecerla, así las áreas superpuestas no se oscurecen dos veces.
+        """
+        if not self.darkness or not lights:
+            layer = self.overlay
+        else:
+            layer = self.darkness_layer
+            for area in ([None] if areas is None else areas):
+                layer.fill((*self.color, self.opacity), area)
+            for (x, y), radius in lights:
+                layer.blit(light_mask(radius, self.opacity), (x - radius, y - radius),
+                           special_flags=pygame.BLEND_RGBA_SUB)
+
+        if areas is None:
+            screen.blit(layer, (0, 0))
+            return
+        for area in areas:
+            if background is not None:
+                screen.blit(background, area, area)
+            screen.blit(layer, area, area)
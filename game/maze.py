@@ -0,0 +1,625 @@
+# game/maze.py
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+
+from game.config import CHASE_RADIUS
+
+# Desplazamientos a las cuatro celdas vecinas (dx, dy)
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+UNREACHABLE = -1
+
+
+class Grid:
+    """
+    Rejilla de ocupación mínima con el mismo formato que ``Level``:
+    ``grid`` es un bytearray de ``cols * rows`` bytes (1 = pared), fila por fila.
+
+    Las funciones de este módulo aceptan indistintamente un ``Grid`` o un ``Level``.
+    """
+
+    def __init__(self, cols, rows, grid=None, goal=None, spawn=None):
+        self.cols = cols
+        self.rows = rows
+        self.grid = grid if grid is not None else bytearray(cols * rows)
+        self.goal = goal  # Celda (col, row) de la meta, o None
+        self.spawn = spawn  # Celda (col, row) de aparición del jugador, o None
+
+    def is_wall(self, col, row):
+        """Indica si la celda (col, row) es una pared. Fuera de la rejilla no hay paredes."""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.grid[row * self.cols + col] == 1
+        return False
+
+
+def is_free(level, cell):
+    """Indica si la celda está dentro de la rejilla y no es pared."""
+    col, row = cell
+    return 0 <= col < level.cols and 0 <= row < level.rows and not level.grid[row * level.cols + col]
+
+
+def _walk_back(parents, cols, index):
+    path = []
+    while index != -1:
+        path.append((index % cols, index // cols))
+        index = parents[index]
+    path.reverse()
+    return path
+
+
+def bfs(level, start, goal):
+    """
+    Camino más corto entre dos celdas por búsqueda en anchura.
+
+    Returns:
+        list: Celdas (col, row) desde ``start`` hasta ``goal``, o None si no hay camino.
+    """
+    if not (is_free(level, start) and is_free(level, goal)):
+        return None
+    cols, rows, grid = level.cols, level.rows, level.grid
+    start_index = start[1] * cols + start[0]
+    goal_index = goal[1] * cols + goal[0]
+    parents = [-2] * (cols * rows)  # -2: sin visitar
+    parents[start_index] = -1
+    frontier = [start_index]
+    while frontier:
+        next_frontier = []
+        for index in frontier:
+            if index == goal_index:
+                return _walk_back(parents, cols, index)
+            col, row = index % cols, index // cols
+            for dx, dy in NEIGHBORS:
+                x, y = col + dx, row + dy
+                if 0 <= x < cols and 0 <= y < rows:
+                    neighbor = y * cols + x
+                    if parents[neighbor] == -2 and not grid[neighbor]:
+                        parents[neighbor] = index
+                        next_frontier.append(neighbor)
+        frontier = next_frontier
+    return None
+
+
+def astar(level, start, goal):
+    """
+    Camino más corto entre dos celdas con A* (heurística Manhattan).
+
+    Returns:
+        list: Celdas (col, row) desde ``start`` hasta ``goal``, o None si no hay camino.
+    """
+    if not (is_free(level, start) and is_free(level, goal)):
+        return None
+    cols, rows, grid = level.cols, level.rows, level.grid
+    goal_col, goal_row = goal
+    start_index = start[1] * cols + start[0]
+    goal_index = goal_row * cols + goal_col
+    parents = {start_index: -1}
+    costs = {start_index: 0}
+    open_set = [(abs(start[0] - goal_col) + abs(start[1] - goal_row), 0, start_index)]
+    while open_set:
+        _, cost, index = heapq.heappop(open_set)
+        if index == goal_index:
+            return _walk_back(parents, cols, index)
+        if cost > costs[index]:
+            continue  # Entrada obsoleta
+        col, row = index % cols, index // cols
+        for dx, dy in NEIGHBORS:
+            x, y = col + dx, row + dy
+            if 0 <= x < cols and 0 <= y < rows:
+                neighbor = y * cols + x
+                new_cost = cost + 1
+                if not grid[neighbor] and new_cost < costs.get(neighbor, new_cost + 1):
+                    costs[neighbor] = new_cost
+                    parents[neighbor] = index
+                    heuristic = abs(x - goal_col) + abs(y - goal_row)
+                    heapq.heappush(open_set, (new_cost + heuristic, new_cost, neighbor))
+    return None
+
+
+def distance_field(level, target):
+    """
+    Distancia en pasos desde cada celda hasta ``target`` (BFS desde el objetivo).
+
+    Returns:
+        numpy.ndarray: Arreglo int32 de forma (rows, cols); ``UNREACHABLE`` en paredes
+        y celdas sin camino.
+    """
+    walls = np.frombuffer(bytes(level.grid), dtype=np.uint8).reshape(level.rows, level.cols)
+    return _distances(walls, target if is_free(level, target) else None)
+
+
+def distance_window(level, target, radius):
+    """
+    Distancias hasta ``target`` solo para las celdas a ``radius`` pasos o menos.
+
+    El BFS recorre únicamente la ventana de ``(2 * radius + 1) ** 2`` celdas
+    alrededor del objetivo (ningún camino de ``radius`` pasos sale de ella),
+    así que el costo no depende del tamaño del laberinto.
+
+    Returns:
+        tuple: ``(distancias, origen)``: arreglo int32 (filas, columnas) de la ventana,
+        con ``UNREACHABLE`` en paredes, celdas sin camino y más allá de ``radius``, y la
+        celda (col, row) de su esquina superior izquierda.
+    """
+    col, row = target
+    left, top = max(col - radius, 0), max(row - radius, 0)
+    right, bottom = min(col + radius + 1, level.cols), min(row + radius + 1, level.rows)
+    walls = np.frombuffer(level.grid, dtype=np.uint8).reshape(level.rows, level.cols)[top:bottom, left:right]
+    start = (col - left, row - top) if is_free(level, target) else None
+    return _distances(walls, start, radius), (left, top)
+
+
+def _distances(walls, start, limit=None):
+    """BFS por niveles sobre ``walls`` (filas, columnas; 1 = pared) desde ``start``, hasta ``limit`` pasos."""
+    rows, cols = walls.shape
+    distances = np.where(walls.ravel(), -2, UNREACHABLE).astype(np.int32)
+    if start is None:
+        distances[distances == -2] = UNREACHABLE
+        return distances.reshape(rows, cols)
+
+    # BFS por niveles sobre una lista plana: -1 libre sin visitar, -2 pared
+    field = distances.tolist()
+    last_col = cols - 1
+    size = cols * rows
+    start = start[1] * cols + start[0]
+    field[start] = 0
+    frontier = [start]
+    distance = 0
+    while frontier and distance != limit:
+        distance += 1
+        next_frontier = []
+        append = next_frontier.append
+        for index in frontier:
+            col = index % cols
+            if col < last_col and field[index + 1] == -1:
+                field[index + 1] = distance
+                append(index + 1)
+            if col > 0 and field[index - 1] == -1:
+                field[index - 1] = distance
+                append(index - 1)
+            below = index + cols
+            if below < size and field[below] == -1:
+                field[below] = distance
+                append(below)
+            above = index - cols
+            if above >= 0 and field[above] == -1:
+                field[above] = distance
+                append(above)
+        frontier = next_frontier
+
+    distances = np.array(field, dtype=np.int32)
+    distances[distances == -2] = UNREACHABLE
+    return distances.reshape(rows, cols)
+
+
+def direction_map(distances):
+    """
+    Dirección (dx, dy) hacia la vecina con menor distancia, para cada celda.
+
+    Returns:
+        numpy.ndarray: Arreglo int8 de forma (rows, cols, 2); (0, 0) en el objetivo,
+        en paredes y en celdas sin camino.
+    """
+    rows, cols = distances.shape
+    big = np.iinfo(np.int32).max
+    padded = np.full((rows + 2, cols + 2), big, dtype=np.int64)
+    padded[1:-1, 1:-1] = np.where(distances == UNREACHABLE, big, distances)
+
+    # Distancias de las cuatro vecinas en el mismo orden que NEIGHBORS
+    candidates = np.stack([
+        padded[1:-1, 2:],   # derecha
+        padded[1:-1, :-2],  # izquierda
+        padded[2:, 1:-1],   # abajo
+        padded[:-2, 1:-1],  # arriba
+    ])
+    best = candidates.argmin(axis=0)
+    improves = np.take_along_axis(candidates, best[None], axis=0)[0] < padded[1:-1, 1:-1]
+
+    offsets = np.array(NEIGHBORS, dtype=np.int8)
+    directions = offsets[best]
+    directions[~improves | (distances == UNREACHABLE)] = 0
+    return directions
+
+
+# --- Generación de laberintos ---------------------------------------------
+#
+# Los laberintos se generan sobre celdas lógicas de ``width x height``; en la
+# rejilla de salida cada celda lógica (x, y) ocupa la posición (2x+1, 2y+1) y
+# las paredes entre celdas ocupan las posiciones intermedias. Todo el estado
+# vive en bytearrays/arreglos planos, sin objetos por celda.
+
+RANDOM_BATCH = 1 << 16  # Números aleatorios pedidos a NumPy de una vez
+
+
+def _carved_grid(width, height):
+    """Rejilla de salida llena de paredes, de (2 * width + 1) x (2 * height + 1)."""
+    return bytearray(b"\x01") * ((2 * width + 1) * (2 * height + 1))
+
+
+def _backtracker(width, height, rng):
+    """Laberinto perfecto por retroceso recursivo (DFS iterativo con pila explícita)."""
+    cols = 2 * width + 1
+    grid = _carved_grid(width, height)
+    total = width * height
+    visited = bytearray(total)
+    last_x = width - 1
+    randoms = rng.integers(0, 12, size=RANDOM_BATCH).tolist()  # 12 es múltiplo de 1, 2, 3 y 4
+    r = 0
+
+    visited[0] = 1
+    grid[cols + 1] = 0
+    stack = [0]
+    push, pop = stack.append, stack.pop
+    while stack:
+        cell = stack[-1]
+        x = cell % width
+        options = []
+        if x < last_x and not visited[cell + 1]:
+            options.append(1)
+        if x > 0 and not visited[cell - 1]:
+            options.append(-1)
+        if cell + width < total and not visited[cell + width]:
+            options.append(width)
+        if cell >= width and not visited[cell - width]:
+            options.append(-width)
+        if not options:
+            pop()
+            continue
+
+        if r == RANDOM_BATCH:
+            randoms = rng.integers(0, 12, size=RANDOM_BATCH).tolist()
+            r = 0
+        step = options[randoms[r] % len(options)]
+        r += 1
+
+        # Abrir la pared intermedia y la celda siguiente en la rejilla de salida
+        position = (2 * (cell // width) + 1) * cols + 2 * x + 1
+        offset = step if step in (1, -1) else (cols if step > 0 else -cols)
+        grid[position + offset] = 0
+        grid[position + 2 * offset] = 0
+        visited[cell + step] = 1
+        push(cell + step)
+    return grid
+
+
+def _kruskal(width, height, rng):
+    """Laberinto perfecto por Kruskal aleatorio (aristas barajadas + unión-búsqueda)."""
+    cols, rows = 2 * width + 1, 2 * height + 1
+    total = width * height
+    cells = np.arange(total).reshape(height, width)
+    horizontal = cells[:, :-1].ravel()
+    vertical = cells[:-1, :].ravel()
+    first = np.concatenate([horizontal, vertical])
+    second = np.concatenate([horizontal + 1, vertical + width])
+    order = rng.permutation(len(first))
+    first, second = first[order], second[order]
+
+    # Posición en la rejilla de salida de la pared entre ambas celdas
+    y, x = np.divmod(first, width)
+    walls = (2 * y + 1) * cols + 2 * x + 1 + np.where(second - first == 1, 1, cols)
+
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    grid[1::2, 1::2] = 0
+    parent = list(range(total))
+    carved = []
+    remaining = total - 1
+    for a, b, wall in zip(first.tolist(), second.tolist(), walls.tolist()):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            parent[a] = b
+            carved.append(wall)
+            remaining -= 1
+            if not remaining:
+                break
+    grid.ravel()[np.array(carved, dtype=np.intp)] = 0
+    return bytearray(grid.tobytes())
+
+
+def _sidewinder(width, height, rng):
+    """
+    Laberinto perfecto por Sidewinder, completamente vectorizado con NumPy.
+
+    Tiene un sesgo conocido (la primera fila es un pasillo recto), a cambio de
+    generar millones de celdas en una fracción de segundo.
+    """
+    cols, rows = 2 * width + 1, 2 * height + 1
+    grid = np.ones((rows, cols), dtype=np.uint8)
+    grid[1::2, 1::2] = 0
+    grid[1, 2:cols - 1:2] = 0  # Primera fila: pasillo completo
+
+    if height > 1:
+        # Filas 1..height-1: cada celda cierra su tramo con probabilidad 1/2 (la última siempre)
+        close = rng.random((height - 1, width)) < 0.5
+        close[:, -1] = True
+        east = ~close[:, :-1]
+        grid[3::2, 2:cols - 1:2][east] = 0
+
+        # Cada tramo abre hacia el norte desde una de sus celdas, elegida al azar
+        flat_close = close.ravel()
+        ends = np.flatnonzero(flat_close)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        lengths = ends - starts + 1
+        chosen = starts + (rng.random(len(starts)) * lengths).astype(np.int64)
+        chosen_y, chosen_x = np.divmod(chosen, width)
+        grid[2 * chosen_y + 2, 2 * chosen_x + 1] = 0
+    return bytearray(grid.tobytes())
+
+
+GENERATORS = {
+    "backtracker": _backtracker,
+    "kruskal": _kruskal,
+    "sidewinder": _sidewinder,
+}
+
+
+def braid(grid, width, height, amount, rng):
+    """
+    Elimina callejones sin salida abriendo una pared al azar en cada uno.
+
+    Args:
+        grid (bytearray): Rejilla de salida (se modifica en el lugar).
+        width (int): Celdas lógicas por fila.
+        height (int): Celdas lógicas por columna.
+        amount (float): Fracción de callejones a eliminar (0 = laberinto perfecto, 1 = ninguno).
+        rng (numpy.random.Generator): Generador aleatorio.
+    """
+    cols, rows = 2 * width + 1, 2 * height + 1
+    view = np.frombuffer(grid, dtype=np.uint8).reshape(rows, cols)
+
+    # Paredes alrededor de cada celda lógica, en el orden de NEIGHBORS (der., izq., abajo, arriba)
+    around = np.stack([
+        view[1::2, 2::2],
+        view[1::2, 0:-1:2],
+        view[2::2, 1::2],
+        view[0:-1:2, 1::2],
+    ], axis=-1).astype(bool)
+    dead_ends = (around.sum(axis=-1) == 3) & (rng.random((height, width)) < amount)
+
+    # Solo se pueden abrir paredes interiores (no el borde exterior)
+    interior = np.ones((height, width, 4), dtype=bool)
+    interior[:, -1, 0] = interior[:, 0, 1] = False
+    interior[-1, :, 2] = interior[0, :, 3] = False
+    candidates = around & interior & dead_ends[..., None]
+
+    ys, xs = np.nonzero(candidates.any(axis=-1))
+    scores = rng.random((len(ys), 4)) * candidates[ys, xs]
+    choice = scores.argmax(axis=-1)
+    offsets = np.array(NEIGHBORS)[choice]
+    view[2 * ys + 1 + offsets[:, 1], 2 * xs + 1 + offsets[:, 0]] = 0
+
+
+def generate_maze(cols, rows, algorithm="backtracker", braid_amount=0.0, seed=None):
+    """
+    Genera un laberinto compatible con ``Level``.
+
+    Args:
+        cols (int): Columnas de la rejilla (incluye paredes). Si es par, la última columna queda como pared.
+        rows (int): Filas de la rejilla. Si es par, la última fila queda como pared.
+        algorithm (str): ``"backtracker"``, ``"kruskal"`` o ``"sidewinder"``.
+        braid_amount (float): Fracción de callejones sin salida a eliminar (laberinto trenzado).
+        seed (int): Semilla; la misma semilla produce el mismo laberinto.
+
+    Returns:
+        Grid: Rejilla con la entrada en (1, 1) y la meta en la celda lógica opuesta.
+    """
+    width, height = (cols - 1) // 2, (rows - 1) // 2
+    if width < 1 or height < 1:
+        raise ValueError(f"El laberinto debe medir al menos 3x3 (se pidió {cols}x{rows})")
+    if algorithm not in GENERATORS:
+        raise ValueError(f"Algoritmo desconocido: {algorithm!r} (opciones: {', '.join(GENERATORS)})")
+
+    rng = np.random.default_rng(seed)
+    grid = GENERATORS[algorithm](width, height, rng)
+    if braid_amount > 0:
+        braid(grid, width, height, braid_amount, rng)
+
+    inner_cols = 2 * width + 1
+    if inner_cols != cols or 2 * height + 1 != rows:
+        # Rellenar con paredes hasta el tamaño pedido
+        padded = np.ones((rows, cols), dtype=np.uint8)
+        padded[:2 * height + 1, :inner_cols] = np.frombuffer(grid, dtype=np.uint8).reshape(-1, inner_cols)
+        grid = bytearray(padded.tobytes())
+    return Grid(cols, rows, grid, goal=(2 * width - 1, 2 * height - 1), spawn=(1, 1))
+
+
+def write_level(maze, file, goals=None):
+    """
+    Escribe una rejilla en el formato de texto de los niveles (``1`` pared, ``0`` piso, ``E`` meta),
+    fila por fila para no construir el archivo completo en memoria.
+
+    Args:
+        maze (Grid): Rejilla a escribir.
+        file: Ruta o archivo de texto abierto.
+        goals (list): Celdas de meta; por defecto, ``maze.goal``.
+    """
+    if goals is None:
+        goals = [maze.goal] if maze.goal is not None else []
+    goals_by_row = {}
+    for col, row in goals:
+        goals_by_row.setdefault(row, []).append(col)
+
+    table = bytes.maketrans(b"\x00\x01", b"01")
+    if isinstance(file, str):
+        with open(file, "w") as handle:
+            return write_level(maze, handle, goals)
+    cols = maze.cols
+    for row in range(maze.rows):
+        line = bytearray(maze.grid[row * cols:(row + 1) * cols].translate(table))
+        for col in goals_by_row.get(row, ()):
+            line[col] = ord("E")
+        file.write(line.decode("ascii") + "\n")
+
+
+class FlowField:
+    """
+    Campos de distancia compartidos para que cualquier número de enemigos persiga al jugador.
+
+    El campo hacia una celda se calcula una sola vez y se guarda en una caché
+    LRU indexada por esa celda; consultar la dirección de un enemigo es una
+    lectura O(1) del mapa de direcciones.
+
+    Con ``radius``, cada campo cubre solo las celdas a esa distancia de camino
+    del objetivo (ver ``distance_window``): cambiar de celda cuesta lo mismo en
+    un laberinto de 20x15 que en uno de 1001x1001, y los enemigos más lejanos
+    no conocen el camino (siguen vagando).
+    """
+
+    def __init__(self, level, cache_size=64, radius=CHASE_RADIUS):
+        """
+        Args:
+            level: ``Level`` o ``Grid``.
+            cache_size (int): Campos que se conservan.
+            radius (int): Alcance de cada campo en pasos; None para todo el nivel.
+        """
+        self.level = level
+        self.cache_size = cache_size
+        self.radius = radius
+        self.hits = 0
+        self.misses = 0
+        self._fields = OrderedDict()  # celda -> (distancias, direcciones, origen de la ventana)
+
+    def _entry(self, target):
+        target = tuple(target)
+        entry = self._fields.get(target)
+        if entry is not None:
+            self.hits += 1
+            self._fields.move_to_end(target)
+            return entry
+
+        self.misses += 1
+        if self.radius is None:
+            distances, origin = distance_field(self.level, target), (0, 0)
+        else:
+            distances, origin = distance_window(self.level, target, self.radius)
+        entry = (distances, direction_map(distances), origin)
+        self._fields[target] = entry
+        if len(self._fields) > self.cache_size:
+            self._fields.popitem(last=False)
+        return entry
+
+    def distances(self, target):
+        """Campo de distancias (rows, cols) de todo el nivel hacia ``target``."""
+        distances, _, (left, top) = self._entry(target)
+        if distances.shape == (self.level.rows, self.level.cols):
+            return distances
+        full = np.full((self.level.rows, self.level.cols), UNREACHABLE, dtype=np.int32)
+        full[top:top + distances.shape[0], left:left + distances.shape[1]] = distances
+        return full
+
+    def next_step(self, cell, target):
+        """Dirección (dx, dy) del siguiente paso desde ``cell`` hacia ``target``."""
+        directions, known = self.directions(np.array([cell]), target)
+        return (int(directions[0, 0]), int(directions[0, 1])) if known[0] else (0, 0)
+
+    def directions(self, cells, target):
+        """
+        Direcciones hacia ``target`` para muchas celdas a la vez.
+
+        Args:
+            cells (numpy.ndarray): Arreglo (N, 2) de celdas (col, row).
+
+        Returns:
+            tuple: Direcciones (N, 2) y máscara booleana de las celdas con camino conocido.
+        """
+        distances, directions, origin = self._entry(target)
+        cells = np.asarray(cells, dtype=np.intp) - origin
+        rows, cols = distances.shape
+        inside = (cells[:, 0] >= 0) & (cells[:, 0] < cols) & (cells[:, 1] >= 0) & (cells[:, 1] < rows)
+        result = np.zeros((len(cells), 2), dtype=np.int8)
+        known = np.zeros(len(cells), dtype=bool)
+        result[inside] = directions[cells[inside, 1], cells[inside, 0]]
+        known[inside] = distances[cells[inside, 1], cells[inside, 0]] > 0
+        return result, known
+
+    def clear(self):
+        """Descarta todos los campos (por ejemplo, si cambian las paredes)."""
+        self._fields.clear()
+
+
+class SpawnIndex:
+    """
+    Celdas libres de un nivel listas para sortear posiciones de aparición.
+
+    Con ``origin``, las celdas quedan ordenadas por distancia de camino a
+    esa celda (las inalcanzables primero), así que "a al menos K pasos" es
+    un sufijo del arreglo: cada sorteo es O(1), sin reintentos, para
+    cualquier cantidad de enemigos.
+    """
+
+    def __init__(self, level, origin=None, margin=0, clearance=0):
+        """
+        Args:
+            level: ``Level`` o ``Grid``.
+            origin (tuple): Celda (col, row) desde la que se miden las distancias, o None.
+            margin (int): Celdas junto a los bordes del nivel que no se usan.
+            clearance (int): Celdas alrededor de ``origin`` (distancia de Chebyshev) que no se usan.
+        """
+        cols, rows = level.cols, level.rows
+        walls = np.frombuffer(bytes(level.grid), dtype=np.uint8).reshape(rows, cols)
+        free = walls == 0
+        if margin:
+            free[:margin, :] = free[-margin:, :] = False
+            free[:, :margin] = free[:, -margin:] = False
+        if origin is not None and clearance:
+            col, row = origin
+            free[max(row - clearance + 1, 0):row + clearance, max(col - clearance + 1, 0):col + clearance] = False
+        cell_rows, cell_cols = np.nonzero(free)
+
+        self.origin = origin
+        if origin is None:
+            self.cells = np.stack([cell_cols, cell_rows], axis=1)
+            self.distances = None
+            self.unreachable = 0
+            return
+        distances = distance_field(level, origin)[cell_rows, cell_cols]
+        order = np.argsort(distances, kind="stable")
+        self.cells = np.stack([cell_cols[order], cell_rows[order]], axis=1)
+        self.distances = distances[order]
+        self.unreachable = int(np.searchsorted(self.distances, 0))  # Las UNREACHABLE (-1) van primero
+
+    def __len__(self):
+        return len(self.cells)
+
+    @property
+    def max_distance(self):
+        """Pasos de camino hasta la celda alcanzable más lejana de ``origin`` (0 si no hay ninguna)."""
+        if self.distances is None or len(self.distances) == 0:
+            return 0
+        return max(int(self.distances[-1]), 0)
+
+    def sample(self, count, rng, min_distance=0, reachable=True):
+        """
+        Sortea ``count`` celdas (con reposición) que cumplan las restricciones.
+
+        Args:
+            count (int): Cantidad de celdas.
+            rng (numpy.random.Generator): Generador aleatorio.
+            min_distance (int): Pasos mínimos de camino desde ``origin`` (requiere ``origin``).
+            reachable (bool): Solo celdas con camino hasta ``origin``; si es False, las
+                inalcanzables también valen (cuentan como infinitamente lejanas).
+
+        Returns:
+            numpy.ndarray: Arreglo (count, 2) de celdas (col, row).
+
+        Raises:
+            ValueError: Si ninguna celda cumple las restricciones.
+        """
+        if self.distances is None:
+            if min_distance > 0:
+                raise ValueError("min_distance requiere un índice con origen")
+            start, unreachable = 0, 0
+        else:
+            start = int(np.searchsorted(self.distances, max(min_distance, 0)))
+            unreachable = 0 if reachable else self.unreachable
+        available = unreachable + len(self.cells) - start
+        if available <= 0:
+            raise ValueError(f"no hay celdas libres a {min_distance} pasos o más de {self.origin}")
+        picks = rng.integers(0, available, size=count)
+        picks = np.where(picks < unreachable, picks, picks - unreachable + start)
+        return self.cells[picks]
@@ -1,10 +1,12 @@
 import pygame
-from game.utils import resource_path
+from game.assets import load_image
+from game.audio import play_sound
+from game.config import PLAYER_SIZE, PLAYER_COLLIDER_MARGIN
 
 class Player:
     def __init__(self, x, y):
         # Cargar el spritesheet
-        self.spritesheet = pygame.image.load(resource_path("assets/images/jogador.png"))
+        self.spritesheet = load_image("assets/images/Jogador.png")
         self.frames = self.load_frames(192, 256, 4, 4)  # Dimensiones del spritesheet (192x256), 4 filas, 4 columnas
 
         # Diccionario para animaciones por dirección
@@ -18,7 +20,7 @@ class Player:
         self.current_frame = 0
 
         # Rectángulo del jugador
-        self.rect = pygame.Rect(x, y, 48, 64)  # Tamaño de cada cuadro (192/4 = 48, 256/4 = 64)
+        self.rect = pygame.Rect(x, y, *PLAYER_SIZE)  # Tamaño de cada cuadro
         self.speed = 3
 
         # Control de tiempo para animaciones
@@ -27,13 +29,8 @@ class Player:
         self.is_moving = False  # Estado de movimiento
         
         # Margen personalizado para el colisionador
-        self.collider_margin = {"left": 10, "right": 10, "top": 30, "bottom": 0}  # Reducir lados
-
-        # Cargar sonido de pasos
-        self.step_sound = pygame.mixer.Sound(resource_path("assets/sounds/steps.wav"))
-        self.step_sound.set_volume(0.5)  # Ajustar el volumen (opcional)
-        self.last_step_time = 0  # Control del tiempo del sonido
-        self.step_interval = 200  # Tiempo entre sonidos de pasos (en milisegundos)
+        self.collider_margin = dict(PLAYER_COLLIDER_MARGIN)  # Reducir lados (game.levelcompiler usa los mismos)
+        self.collider = self.get_collider_rect()  # Colisionador reutilizado en cada movimiento
 
     def load_frames(self, width, height, rows, cols):
         """Divide el spritesheet en una lista de cuadros por filas y columnas."""
@@ -51,9 +48,18 @@ class Player:
             frames.append(row_frames)
         return frames
 
-    def handle_input(self, walls=None):
-        """Mueve al jugador y cambia la animación según la dirección."""
-        keys = pygame.key.get_pressed()
+    def handle_input(self, walls=None, keys=None):
+        """
+        Mueve al jugador y cambia la animación según la dirección.
+
+        Args:
+            walls: El nivel actual (cualquier objeto con ``collides(rect)``, como ``Level``)
+                o, por compatibilidad, la matriz de rectángulos ``Level.tiles``.
+            keys: Estado de las teclas indexable por ``pygame.K_*``. Por defecto se lee
+                el teclado con ``pygame.key.get_pressed()``.
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
         dx, dy = 0, 0
         self.is_moving = False  # Asumimos que no hay movimiento
 
@@ -79,15 +85,26 @@ class Player:
         self.rect.y += dy
 
         # Verificar colisiones con paredes
-        if walls:
-            collider = self.get_collider_rect()  # Obtener el colisionador ajustado
-            for row in walls:
-                for wall in row:
-                    if collider.colliderect(wall):  # Verificar colisión
-                        # Deshacer movimiento
-                        self.rect.x -= dx
-                        self.rect.y -= dy
-                        return
+        if walls and self.collides_with(walls):
+            # Deshacer movimiento
+            self.rect.x -= dx
+            self.rect.y -= dy
+
+    def collides_with(self, walls):
+        """Indica si el colisionador del jugador toca alguna pared."""
+        margin = self.collider_margin
+        collider = self.collider
+        collider.x = self.rect.x + margin["left"]
+        collider.y = self.rect.y + margin["top"]
+
+        if hasattr(walls, "collides"):  # Rejilla de ocupación del nivel
+            return walls.collides(collider)
+
+        for row in walls:  # Recorrido completo de Level.tiles
+            for wall in row:
+                if collider.colliderect(wall):
+                    return True
+        return False
 
     def update(self):
         """Actualiza el frame actual para la animación y reproduce el sonido de pasos."""
@@ -98,10 +115,8 @@ class Player:
                 self.last_update = now
                 self.current_frame = (self.current_frame + 1) % len(self.animations[self.current_animation])
 
-            # Reproducir sonido de pasos
-            if now - self.last_step_time > self.step_interval:
-                self.step_sound.play()
-                self.last_step_time = now
+            # Reproducir sonido de pasos (game.audio limita la frecuencia)
+            play_sound("steps", self.rect.center)
         else:
             self.current_frame = 0  # Frame estático si no se mueve
     
@@ -115,10 +130,15 @@ class Player:
             self.rect.height - margin["top"] - margin["bottom"]
         )
 
-    def render(self, screen):
-        """Renderiza el cuadro actual del jugador."""
+    def render(self, screen, position=None):
+        """
+        Renderiza el cuadro actual del jugador (en ``position`` si se indica, p. ej. interpolada).
+
+        Returns:
+            pygame.Rect: Área de la pantalla modificada.
+        """
         frame = self.animations[self.current_animation][self.current_frame]
-        screen.blit(frame, self.rect)
+        return screen.blit(frame, self.rect if position is None else position)
         
         # # Debug: Renderizar el colisionador
         # pygame.draw.rect(screen, (255, 0, 0), self.get_collider_rect(), 1)  # Visualizar el colisionador
@@ -0,0 +1,201 @@
+# game/preload.py
+"""
+Precarga de recursos en segundo plano mientras se muestra la pantalla de inicio.
+
+Los hilos del pool leen y decodifican imágenes (incluidos recortes y
+escalados) y sonidos, y compilan los niveles de texto; ``pygame.image.load`` y
+``pygame.transform.scale`` liberan el GIL mientras trabajan. El hilo
+principal llama a ``Preloader.poll`` una vez por cuadro: entrega lo ya
+decodificado a la caché de ``game.assets`` y hace solo la conversión al
+formato de la pantalla, con un presupuesto de tiempo por cuadro.
+
+La música (``pygame.mixer.music``) se reproduce en streaming desde el
+archivo y no se precarga.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from game import assets
+from game.atlas import ENEMY_FRAMES, TREE_SPRITESHEET, tree_sources
+from game.levelcompiler import compile_level
+from game.utils import resource_path
+
+
+def game_assets(levels):
+    """
+    Recursos que carga la partida (``Player``, ``EnemySwarm`` y ``Level``).
+
+    Args:
+        levels (list): Rutas de los niveles de texto, tal como las recibe ``Level``.
+
+    Returns:
+        list: Pedidos ``(tipo, ruta, variantes)``; cada variante de imagen es ``(recorte, tamaño, alpha)``.
+    """
+    requests = [
+        ("image", "assets/images/Jogador.png", [(None, None, True)]),
+        ("image", "assets/autotiles/Chão (4).png", [(None, None, True)]),
+        ("image", TREE_SPRITESHEET, [(None, None, True)] + [(area, (40, 40), True) for _, area in tree_sources()]),
+        ("sound", "assets/sounds/steps.wav", None),
+        ("sound", "assets/sounds/flying.wav", None),
+    ]
+    requests += [("image", os.path.join(ENEMY_FRAMES, name), [(None, (120, 120), True)])
+                 for name in assets.cache.listing(ENEMY_FRAMES)]
+    requests += [("level", level, None) for level in levels if not level.endswith(".lvl")]
+    return use_atlases(requests)
+
+
+def use_atlases(requests, cache=None):
+    """
+    Agrupa las imágenes empaquetadas en atlas (``game.atlas``) en un pedido por atlas.
+
+    Cada pedido ``("atlas", ruta del atlas, variantes)`` decodifica el atlas una
+    sola vez; sus variantes son ``(imagen de origen, recorte, tamaño, alpha, rectángulo)``.
+    """
+    cache = cache or assets.cache
+    atlases = {}
+    remaining = []
+    for kind, relative_path, variants in requests:
+        if kind == "image":
+            unpacked = []
+            for area, size, alpha in variants:
+                packed = cache.packed(relative_path, area)
+                if packed is None:
+                    unpacked.append((area, size, alpha))
+                else:
+                    atlas_path, rect = packed
+                    atlases.setdefault(atlas_path, []).append((relative_path, area, size, alpha, rect))
+            if not unpacked:
+                continue
+            variants = unpacked
+        remaining.append((kind, relative_path, variants))
+    return [("atlas", atlas_path, variants) for atlas_path, variants in atlases.items()] + remaining
+
+
+def _crop(sheet, area, size):
+    """Recorta y escala una imagen sin convertirla."""
+    surface = sheet.subsurface(pygame.Rect(area)) if area is not None else sheet
+    if size is not None and surface.get_size() != tuple(size):
+        return pygame.transform.scale(surface, size)
+    if area is not None:
+        return surface.copy()  # No mantener la hoja completa viva por un recorte
+    return surface
+
+
+def _decode(kind, relative_path, variants):
+    """Trabajo de un hilo del pool: lee y decodifica un archivo (sin convertir)."""
+    path = resource_path(relative_path)
+    if kind == "level":
+        return compile_level(path)  # Queda en la caché de game.levelcompiler (y en disco)
+    if kind == "sound":
+        return pygame.mixer.Sound(path)
+
+    sheet = pygame.image.load(path)
+    if kind == "atlas":
+        return [_crop(sheet, rect, size) for _, _, size, _, rect in variants]
+    return [_crop(sheet, area, size) for area, size, _ in variants]
+
+
+class Preloader:
+    """
+    Decodifica una lista de recursos en un pool de hilos y los entrega a la caché desde el hilo principal.
+    """
+
+    def __init__(self, requests, workers=4, cache=None):
+        """
+        Args:
+            requests (list): Pedidos ``(tipo, ruta, variantes)`` (ver ``game_assets``).
+            workers (int): Hilos del pool.
+            cache (AssetCache): Caché destino; por defecto, la compartida de ``game.assets``.
+        """
+        self.requests = requests
+        self.cache = cache or assets.cache
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload")
+        self.pending = []  # (pedido, future), en orden de envío
+        self.installed = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        """Envía todos los pedidos al pool; no bloquea."""
+        self.started_at = time.perf_counter()
+        self.pending = [(request, self.executor.submit(_decode, *request)) for request in self.requests]
+        return self
+
+    @property
+    def total(self):
+        return len(self.requests)
+
+    @property
+    def progress(self):
+        """Fracción de recursos ya disponibles en la caché (0 a 1)."""
+        return self.installed / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return self.installed == self.total
+
+    def _install(self, request, decoded):
+        """Entrega un recurso decodificado a la caché y lo convierte (hilo principal)."""
+        kind, relative_path, variants = request
+        cache = self.cache
+        if kind == "image":
+            for (area, size, alpha), surface in zip(variants, decoded):
+                cache.prepare(("image", relative_path, area, size), surface)
+                cache.image(relative_path, size=size, area=area, alpha=alpha, owner=assets.PRELOAD_OWNER)
+        elif kind == "level":
+            pass  # Ya compilado por el hilo
+        elif kind == "atlas":
+            for (source, area, size, alpha, _), surface in zip(variants, decoded):
+                cache.prepare(("image", source, area, size), surface)
+                cache.image(source, size=size, area=area, alpha=alpha, owner=assets.PRELOAD_OWNER)
+        else:
+            cache.prepare((kind, relative_path), decoded)
+            getattr(cache, kind)(relative_path, owner=assets.PRELOAD_OWNER)
+        self.installed += 1
+
+    def poll(self, budget=0.004):
+        """
+        Instala en la caché los recursos que ya terminaron de decodificarse.
+
+        Args:
+            budget (float): Segundos máximos por llamada, para no alargar el cuadro.
+
+        Returns:
+            float: El progreso después de la llamada.
+        """
+        deadline = time.perf_counter() + budget
+        remaining = []
+        for index, (request, future) in enumerate(self.pending):
+            if time.perf_counter() > deadline:
+                remaining.extend(self.pending[index:])
+                break
+            if future.done():
+                self._install(request, future.result())
+            else:
+                remaining.append((request, future))
+        self.pending = remaining
+        if self.done and self.finished_at is None:
+            self._finish()
+        return self.progress
+
+    def finish(self):
+        """Espera e instala todo lo pendiente (por ejemplo, si se presiona Enter antes de terminar)."""
+        for request, future in self.pending:
+            self._install(request, future.result())
+        self.pending = []
+        if self.finished_at is None:
+            self._finish()
+
+    def _finish(self):
+        self.finished_at = time.perf_counter()
+        self.executor.shutdown(wait=False)
+
+    @property
+    def elapsed(self):
+        """Segundos desde ``start`` hasta que todo quedó en la caché (None si sigue en curso)."""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
@@ -0,0 +1,208 @@
+# game/profiler.py
+import contextlib
+import csv
+import json
+import math
+import time
+
+import numpy as np
+import pygame
+
+from game.config import FPS
+from game.text import render_text
+
+PERCENTILES = (50, 95, 99)
+FRAME = "frame"  # Nombre de la fase con el tiempo total de cada cuadro
+
+
+class _Span:
+    """Intervalo de tiempo con nombre; se reutiliza en cada cuadro (no es reentrante)."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class FrameProfiler:
+    """
+    Tiempos por fase de cada cuadro, guardados en búferes circulares de tamaño fijo.
+
+    Uso::
+
+        profiler.begin_frame()
+        with profiler.span("level.render"):
+            level.render(camera)
+        profiler.end_frame()
+
+    Si una fase se ejecuta varias veces en un cuadro (por ejemplo, varios pasos
+    de simulación), sus tiempos se suman en el mismo cuadro. Los cuadros en los
+    que una fase no se ejecuta (pantalla de inicio, fundidos...) quedan en NaN y
+    no cuentan para sus percentiles.
+    """
+
+    def __init__(self, capacity=600, enabled=True):
+        """
+        Args:
+            capacity (int): Cuadros que se conservan por fase.
+            enabled (bool): Si es False, ``span`` no mide nada.
+        """
+        self.capacity = capacity
+        self.enabled = enabled
+        self.frames = 0  # Cuadros completados
+        self.samples = {}  # fase -> numpy.ndarray de segundos por cuadro (NaN si no se ejecutó)
+        self._spans = {}
+        self._frame_start = 0.0
+
+        # Superposición en pantalla
+        self.show_overlay = False
+        self._overlay_lines = []
+        self._overlay_surface = None
+
+    def span(self, name):
+        """Devuelve un context manager que mide la fase ``name`` dentro del cuadro actual."""
+        if not self.enabled:
+            return _NULL_SPAN
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = _Span(self, name)
+        return span
+
+    def add(self, name, seconds):
+        """Suma ``seconds`` a la fase ``name`` del cuadro actual."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = np.full(self.capacity, np.nan)
+        slot = self.frames % self.capacity
+        previous = samples[slot]
+        samples[slot] = seconds if math.isnan(previous) else previous + seconds
+
+    def begin_frame(self):
+        """Empieza un cuadro: limpia su posición en los búferes."""
+        if not self.enabled:
+            return
+        slot = self.frames % self.capacity
+        for samples in self.samples.values():
+            samples[slot] = np.nan
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Termina el cuadro actual registrando su duración total."""
+        if not self.enabled:
+            return
+        self.add(FRAME, time.perf_counter() - self._frame_start)
+        self.frames += 1
+
+    def _recorded(self, name):
+        """Muestras de una fase, de la más antigua a la más reciente (NaN en los cuadros sin la fase)."""
+        samples = self.samples[name]
+        if self.frames < self.capacity:
+            return samples[:self.frames]
+        return np.roll(samples, -(self.frames % self.capacity))
+
+    def report(self):
+        """
+        Resumen por fase en milisegundos.
+
+        Returns:
+            dict: fase -> {"mean", "p50", "p95", "p99", "max"}.
+        """
+        summary = {}
+        for name in self.samples:
+            recorded = self._recorded(name) * 1000
+            recorded = recorded[~np.isnan(recorded)]
+            if not len(recorded):
+                continue
+            p50, p95, p99 = np.percentile(recorded, PERCENTILES)
+            summary[name] = {
+                "mean": float(recorded.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+                "max": float(recorded.max()),
+            }
+        return summary
+
+    def dump(self, path):
+        """
+        Guarda la sesión en JSON (resumen y muestras) o CSV (una fila por cuadro, ms por fase),
+        según la extensión de ``path``. Los cuadros en los que una fase no se ejecutó quedan
+        vacíos (``null`` en JSON).
+        """
+        names = sorted(self.samples)
+        if path.endswith(".csv"):
+            columns = [self._recorded(name) * 1000 for name in names]
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["frame"] + [f"{name}_ms" for name in names])
+                first = self.frames - len(columns[0]) if columns else 0
+                for i, row in enumerate(zip(*columns)):
+                    writer.writerow([first + i] + ["" if math.isnan(value) else f"{value:.4f}" for value in row])
+            return
+
+        with open(path, "w") as file:
+            json.dump({
+                "frames": self.frames,
+                "capacity": self.capacity,
+                "summary": self.report(),
+                "samples_ms": {name: [None if math.isnan(value) else value
+                                      for value in (self._recorded(name) * 1000).round(4).tolist()]
+                               for name in names},
+            }, file, indent=2)
+
+    def toggle_overlay(self):
+        """Muestra u oculta el gráfico de tiempos en pantalla."""
+        self.show_overlay = not self.show_overlay
+
+    def render_overlay(self, screen, width=300, height=80, refresh=30):
+        """
+        Dibuja el gráfico de duración de los últimos cuadros y los percentiles por fase.
+
+        Args:
+            screen (pygame.Surface): Superficie destino.
+            width (int): Ancho del gráfico (un píxel por cuadro).
+            height (int): Alto del gráfico; la línea media marca el presupuesto de 1/FPS.
+            refresh (int): Cada cuántos cuadros se recalculan los textos.
+        """
+        if not self.show_overlay or FRAME not in self.samples:
+            return
+        if self._overlay_surface is None:
+            self._overlay_surface = pygame.Surface((width, height))
+            self._overlay_surface.set_alpha(200)
+
+        # Gráfico: 2 * presupuesto de cuadro a lo alto
+        budget = 1.0 / FPS
+        graph = self._overlay_surface
+        graph.fill((0, 0, 0))
+        pygame.draw.line(graph, (0, 160, 0), (0, height // 2), (width, height // 2))
+        recent = self._recorded(FRAME)[-width:]
+        if len(recent) > 1:
+            heights = np.clip(recent / (2 * budget), 0, 1) * (height - 1)
+            points = [(x, height - 1 - int(y)) for x, y in enumerate(heights.tolist())]
+            pygame.draw.lines(graph, (255, 255, 0), False, points)
+        screen.blit(graph, (8, 8))
+
+        # Percentiles por fase (los textos solo cambian cada ``refresh`` cuadros)
+        if self.frames % refresh == 0 or not self._overlay_lines:
+            self._overlay_lines = [
+                f"{name}: {values['p50']:.2f} / {values['p95']:.2f} / {values['p99']:.2f} ms"
+                for name, values in sorted(self.report().items())
+            ]
+        y = height + 12
+        for line in self._overlay_lines:
+            text = render_text(line, 20, (255, 255, 255))
+            screen.blit(text, (8, y))
+            y += text.get_height()
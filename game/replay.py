@@ -0,0 +1,247 @@
+# game/replay.py
+"""
+Grabación determinista de partidas y reproducción sin ventana a máxima velocidad.
+
+Cada intento de nivel es un segmento: nivel, semilla de los enemigos,
+posición inicial y el estado de las cuatro flechas en cada paso de
+simulación (un byte por paso, comprimido con zlib). Reproducir un segmento
+vuelve a crear el nivel y los enemigos con la misma semilla y alimenta
+``Player.handle_input`` con las teclas grabadas, así que el resultado es
+idéntico al de la partida original.
+
+Reproducción (desde la raíz del repositorio):
+    python -m game.replay partida.rep
+    python -m game.replay partida.rep --seek 1200 --snapshot-every 300
+"""
+import argparse
+import struct
+import sys
+import time
+import zlib
+
+import pygame
+
+from game.simulation import GAME_OVER, GOAL, Simulation, pressed
+
+MAGIC = b"LABR"
+VERSION = 5  # 2: enemigos sorteados con Level.spawn_index; 3: los enemigos rebotan en las paredes;
+# 4: sorteo y movimiento de los enemigos con flujos aleatorios independientes; 5: persecución hasta CHASE_RADIUS
+HEADER = struct.Struct("<4sHH")  # magic, versión, cantidad de segmentos
+SEGMENT = struct.Struct("<QiiHfBBII")  # semilla, x, y, enemigos, velocidad, persecución, resultado, pasos, bytes
+
+# Bits del byte de entrada de cada paso
+KEY_BITS = ((pygame.K_UP, 1), (pygame.K_DOWN, 2), (pygame.K_LEFT, 4), (pygame.K_RIGHT, 8))
+RESULTS = {None: 0, GAME_OVER: 1, GOAL: 2}
+RESULT_NAMES = {code: name for name, code in RESULTS.items()}
+
+# Estados de teclado ya decodificados, uno por combinación posible de flechas
+_DECODED = [pressed(*(key for key, bit in KEY_BITS if code & bit)) for code in range(16)]
+
+
+def encode_keys(keys):
+    """Codifica el estado de las flechas en un byte."""
+    code = 0
+    for key, bit in KEY_BITS:
+        if keys[key]:
+            code |= bit
+    return code
+
+
+def decode_keys(code):
+    """Devuelve un estado de teclado (indexable por ``pygame.K_*``) para un byte grabado."""
+    return _DECODED[code]
+
+
+class Segment:
+    """Un intento de nivel grabado."""
+
+    def __init__(self, level_file, seed, initial_position, enemy_count, enemy_speed, chase=False):
+        self.level_file = level_file
+        self.seed = seed
+        self.initial_position = tuple(initial_position)
+        self.enemy_count = enemy_count
+        self.enemy_speed = enemy_speed
+        self.chase = chase
+        self.inputs = bytearray()  # Un byte por paso
+        self.result = None
+
+    def pack(self):
+        path = self.level_file.encode("utf-8")
+        data = zlib.compress(bytes(self.inputs), 9)
+        return (struct.pack("<H", len(path)) + path
+                + SEGMENT.pack(self.seed, *self.initial_position, self.enemy_count, self.enemy_speed,
+                               self.chase, RESULTS[self.result], len(self.inputs), len(data))
+                + data)
+
+
+class Recorder:
+    """
+    Graba los pasos de simulación de una sesión.
+
+    ``GameScene`` llama a ``begin`` al empezar cada intento de nivel, la
+    ``Simulation`` llama a ``record`` en cada paso y ``end`` guarda el resultado.
+    """
+
+    def __init__(self):
+        self.segments = []
+        self.current = None
+
+    def begin(self, level_file, seed, initial_position, enemy_count, enemy_speed, chase=False):
+        self.current = Segment(level_file, seed, initial_position, enemy_count, enemy_speed, chase)
+        self.segments.append(self.current)
+
+    def record(self, keys):
+        if self.current is not None:
+            self.current.inputs.append(encode_keys(keys))
+
+    def end(self, result):
+        if self.current is not None:
+            self.current.result = result
+            self.current = None
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, len(self.segments)))
+            for segment in self.segments:
+                file.write(segment.pack())
+
+
+def load_recording(path):
+    """Lee un archivo de grabación y devuelve su lista de segmentos."""
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} no es una grabación (magic {magic!r})")
+    if version != VERSION:
+        raise ValueError(f"{path}: versión {version} no soportada (se esperaba {VERSION})")
+
+    segments = []
+    offset = HEADER.size
+    for _ in range(count):
+        (length,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        level_file = data[offset:offset + length].decode("utf-8")
+        offset += length
+        seed, x, y, enemy_count, enemy_speed, chase, result, ticks, size = SEGMENT.unpack_from(data, offset)
+        offset += SEGMENT.size
+        segment = Segment(level_file, seed, (x, y), enemy_count, enemy_speed, bool(chase))
+        segment.inputs = bytearray(zlib.decompress(data[offset:offset + size]))
+        segment.result = RESULT_NAMES[result]
+        offset += size
+        if len(segment.inputs) != ticks:
+            raise ValueError(f"{path}: segmento dañado ({len(segment.inputs)} pasos, se esperaban {ticks})")
+        segments.append(segment)
+    return segments
+
+
+class Replayer:
+    """
+    Reproduce un segmento sin renderizar, con instantáneas periódicas para poder saltar a cualquier paso.
+    """
+
+    def __init__(self, segment, screen, snapshot_every=600):
+        # Importaciones locales: game.scenes importa este módulo
+        from game.level import Level
+        from game.maze import FlowField
+        from game.player import Player
+        from game.scenes import create_enemies
+
+        self.segment = segment
+        self.snapshot_every = snapshot_every
+        self.snapshots = {}  # paso -> estado
+
+        level = Level(segment.level_file, screen)
+        player = Player(*segment.initial_position)
+        enemies = create_enemies(player.rect, *level.pixel_size(), count=segment.enemy_count,
+                                 speed=segment.enemy_speed, seed=segment.seed, level=level)
+        flow_field = FlowField(level) if segment.chase else None
+        self.simulation = Simulation(level, player, enemies, flow_field=flow_field)
+        self.result = None
+        self.take_snapshot()
+
+    def take_snapshot(self):
+        """Guarda el estado de la simulación en el paso actual."""
+        simulation = self.simulation
+        player, enemies = simulation.player, simulation.enemy
+        self.snapshots[simulation.ticks] = (
+            tuple(player.rect),
+            player.current_animation,
+            enemies.positions.copy(),
+            enemies.previous.copy(),
+            enemies.directions.copy(),
+            enemies.rng.bit_generator.state,
+            self.result,
+        )
+
+    def restore(self, tick):
+        """Vuelve al estado guardado en ``tick``."""
+        rect, animation, positions, previous, directions, rng_state, result = self.snapshots[tick]
+        simulation = self.simulation
+        simulation.player.rect.update(rect)
+        simulation.player.current_animation = animation
+        simulation.enemy.positions[:] = positions
+        simulation.enemy.previous[:] = previous
+        simulation.enemy.directions[:] = directions
+        simulation.enemy.rng.bit_generator.state = rng_state
+        simulation.ticks = tick
+        simulation.remember_positions()
+        self.result = result
+
+    def run(self, until=None):
+        """
+        Ejecuta pasos hasta ``until`` (por defecto, el final de la grabación) o hasta que el nivel termine.
+
+        Returns:
+            str: ``GAME_OVER``, ``GOAL`` o None.
+        """
+        inputs = self.segment.inputs
+        end = len(inputs) if until is None else min(until, len(inputs))
+        simulation = self.simulation
+        while simulation.ticks < end and self.result is None:
+            self.result = simulation.step(decode_keys(inputs[simulation.ticks]))
+            if simulation.ticks % self.snapshot_every == 0:
+                self.take_snapshot()
+        return self.result
+
+    def seek(self, tick):
+        """Salta al paso ``tick`` desde la instantánea anterior más cercana."""
+        start = max(t for t in self.snapshots if t <= tick)
+        self.restore(start)
+        self.run(until=tick)
+
+
+def main(argv=None):
+    from game.simulation import init_headless
+
+    parser = argparse.ArgumentParser(description="Reproduce una grabación sin ventana")
+    parser.add_argument("recording", help="archivo grabado con 'main.py --record'")
+    parser.add_argument("--snapshot-every", type=int, default=600, help="pasos entre instantáneas")
+    parser.add_argument("--seek", type=int, help="saltar a este paso del primer segmento y mostrar el estado")
+    args = parser.parse_args(argv)
+
+    screen = init_headless()
+    segments = load_recording(args.recording)
+    mismatches = 0
+    for index, segment in enumerate(segments):
+        replayer = Replayer(segment, screen, args.snapshot_every)
+        start = time.perf_counter()
+        result = replayer.run()
+        elapsed = time.perf_counter() - start
+        ticks = replayer.simulation.ticks
+        ok = result == segment.result
+        mismatches += not ok
+        print(f"[{index}] {segment.level_file}: {ticks} pasos en {elapsed:.3f} s "
+              f"({ticks / max(elapsed, 1e-9):,.0f} pasos/s), resultado {result} "
+              f"({'coincide' if ok else f'se esperaba {segment.result}'})")
+
+        if args.seek is not None and index == 0:
+            replayer.seek(args.seek)
+            print(f"    paso {replayer.simulation.ticks}: jugador en {replayer.simulation.player.rect.topleft}")
+
+    pygame.quit()
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
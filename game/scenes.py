@@ -0,0 +1,447 @@
+# game/scenes.py
+import random
+import time
+
+import numpy as np
+import pygame
+
+from game.assets import load_image
+from game.audio import voices
+from game.camera import Camera
+from game.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TRANSITION_TIME, ENEMY_COUNT, ENEMY_CHASE, DIRTY_RECTS, MAX_DIRTY_RECTS,
+    ENEMY_SIZE, ENEMY_SPAWN_DISTANCE, TILE_SIZE, PLAYER_START,
+    NIGHT_OPACITY, DARKNESS_MODE, PLAYER_LIGHT_RADIUS, GOAL_LIGHT_RADIUS, FOG_OF_WAR,
+)
+from game.levelstream import LevelStream
+from game.lighting import Lighting
+from game.maze import FlowField
+from game.player import Player
+from game.profiler import FrameProfiler
+from game.simulation import Simulation, GAME_OVER, GOAL
+from game.swarm import EnemySwarm
+from game.text import render_text
+from game.visibility import Fog
+from game.utils import resource_path
+
+# Niveles de una partida, en orden
+LEVELS = ["assets/levels/level1.txt", "assets/levels/level2.txt"]
+
+
+class Scene:
+    """Pantalla del juego (inicio, partida, game over...) dirigida por un ``SceneManager``."""
+
+    def __init__(self, manager):
+        self.manager = manager
+
+    def enter(self):
+        """Se llama cuando la escena pasa a ser la actual (con la pantalla en negro)."""
+
+    def exit(self):
+        """Se llama justo antes de reemplazar la escena."""
+
+    def handle_event(self, event):
+        """Procesa un evento de pygame (no se llama durante los fundidos)."""
+
+    def update(self, elapsed):
+        """Avanza la lógica ``elapsed`` segundos (no se llama durante los fundidos)."""
+
+    def render(self, screen):
+        """
+        Dibuja la escena.
+
+        Returns:
+            list: Rectángulos de la pantalla que cambiaron, o None si hay que actualizarla completa.
+        """
+
+    def invalidate(self):
+        """La pantalla ya no muestra el último cuadro de la escena: el próximo ``render`` debe ser completo."""
+
+
+class SceneManager:
+    """
+    Ejecuta todas las escenas dentro de un único bucle principal.
+
+    Los cambios de escena son fundidos a negro basados en tiempo: durante el
+    fundido se siguen procesando los eventos y dibujando la escena a la tasa
+    de cuadros normal, en lugar de bloquear el bucle con ``pygame.time.delay``.
+
+    Con ``dirty_rects`` solo se envían a la ventana las regiones que la escena
+    informa como modificadas (``pygame.display.update(rects)``); los fundidos,
+    el gráfico de tiempos y las escenas que no informan regiones usan
+    ``pygame.display.flip()``.
+    """
+
+    def __init__(self, screen, fps=FPS, profiler=None, dirty_rects=DIRTY_RECTS):
+        self.screen = screen
+        self.fps = fps
+        self.dirty_rects = dirty_rects
+        self.profiler = profiler or FrameProfiler()  # F3 muestra el gráfico de tiempos
+        self.clock = pygame.time.Clock()
+        self.scene = None
+        self.running = False
+        self.first_frame_at = None  # time.perf_counter() al mostrar el primer cuadro
+
+        # Fundido en curso: "out" (hacia negro), "in" (desde negro) o None
+        self.fade_phase = None
+        self.fade_elapsed = 0.0
+        self.fade_out_time = 0.0
+        self.fade_in_time = 0.0
+        self.next_scene = None
+        self.fade_surface = pygame.Surface(screen.get_size())
+        self.fade_surface.fill((0, 0, 0))  # Negro sólido
+
+    def switch(self, scene, fade_out=TRANSITION_TIME, fade_in=TRANSITION_TIME):
+        """
+        Programa el cambio a ``scene`` con un fundido a negro y de vuelta.
+
+        Args:
+            scene (Scene): Escena siguiente (puede ser la misma, para reiniciarla).
+            fade_out (float): Segundos del fundido hacia negro.
+            fade_in (float): Segundos del fundido desde negro.
+        """
+        self.next_scene = scene
+        self.fade_out_time = fade_out
+        self.fade_in_time = fade_in
+        self.fade_elapsed = 0.0
+        self.fade_phase = "out" if self.scene is not None else "in"
+        if self.fade_phase == "in":
+            self._swap()
+
+    def _swap(self):
+        if self.scene is not None:
+            self.scene.exit()
+        self.scene, self.next_scene = self.next_scene, None
+        self.scene.enter()
+        self.clock.tick()  # No contar la carga de la escena como tiempo de juego
+
+    def quit(self):
+        """Termina el bucle principal al final del cuadro actual."""
+        self.running = False
+
+    def _update_fade(self, elapsed):
+        """Avanza el fundido y devuelve la opacidad del negro (0-255)."""
+        self.fade_elapsed += elapsed
+        if self.fade_phase == "out":
+            if self.fade_elapsed >= self.fade_out_time:
+                self._swap()
+                self.fade_phase = "in"
+                self.fade_elapsed = 0.0
+                return 255
+            return int(255 * self.fade_elapsed / self.fade_out_time)
+
+        if self.fade_elapsed >= self.fade_in_time:
+            self.fade_phase = None
+            return 0
+        return int(255 * (1 - self.fade_elapsed / self.fade_in_time))
+
+    def run(self, scene):
+        """Bucle principal: corre hasta que una escena llama a ``quit`` o se cierra la ventana.
+
+        Al terminar llama a ``exit`` de la escena activa.
+        """
+        self.switch(scene)
+        self.running = True
+        profiler = self.profiler
+        while self.running:
+            elapsed = self.clock.tick(self.fps) / 1000
+            profiler.begin_frame()
+            transitioning = self.fade_phase is not None
+
+            with profiler.span("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.quit()
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle_overlay()
+                    elif not transitioning:
+                        self.scene.handle_event(event)
+
+            with profiler.span("scene.update"):
+                if transitioning:
+                    alpha = self._update_fade(elapsed)
+                else:
+                    self.scene.update(elapsed)
+                    alpha = 0
+
+            with profiler.span("scene.render"):
+                changed = self.scene.render(self.screen)
+                if alpha or profiler.show_overlay:
+                    # Algo más se dibuja encima: el próximo cuadro de la escena debe ser completo
+                    changed = None
+                    self.scene.invalidate()
+                if alpha:
+                    self.fade_surface.set_alpha(alpha)
+                    self.screen.blit(self.fade_surface, (0, 0))
+                profiler.render_overlay(self.screen)
+
+            with profiler.span("display.flip"):
+                if self.dirty_rects and changed is not None and len(changed) <= MAX_DIRTY_RECTS:
+                    pygame.display.update(changed)
+                else:
+                    pygame.display.flip()
+            profiler.end_frame()
+            if self.first_frame_at is None:
+                self.first_frame_at = time.perf_counter()
+
+        # Al salir, la escena activa también termina (GameScene detiene su hilo de precarga)
+        self.scene.exit()
+
+
+class StartScene(Scene):
+    """Pantalla de inicio del juego."""
+
+    def __init__(self, manager, game=None, preloader=None):
+        super().__init__(manager)
+        self.game = game  # Partida a la que se vuelve; se crea al presionar Enter si no existe
+        self.preloader = preloader  # game.preload.Preloader ya iniciado, o None
+
+        # Cargar imágenes (ajustando el fondo al tamaño de la pantalla)
+        self.background = load_image("assets/images/credits5.png", size=(SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+        self.title = load_image("assets/images/pokelogo (low res).png")
+        self.title_rect = self.title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
+
+    def enter(self):
+        # Cargar y reproducir música de la pantalla de inicio
+        pygame.mixer.music.load(resource_path("assets/music/intro.mp3"))
+        pygame.mixer.music.play(-1)
+
+    def exit(self):
+        pygame.mixer.music.stop()  # Detener la música de la pantalla de inicio
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN:
+            if self.preloader is not None:
+                self.preloader.finish()  # Lo que falte se carga ahora, bajo el fundido
+            if self.game is None:
+                self.game = GameScene(self.manager)
+            self.manager.switch(self.game)
+
+    def update(self, elapsed):
+        # Pasar a la caché los recursos que los hilos ya decodificaron
+        if self.preloader is not None and not self.preloader.done:
+            self.preloader.poll()
+
+    def render(self, screen):
+        screen.blit(self.background, (0, 0))
+        screen.blit(self.title, self.title_rect)
+
+        # Dibujar el texto debajo del título
+        text = render_text("Presione Enter para empezar", 36, (255, 255, 255))
+        screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+
+        # Barra de progreso de la precarga
+        if self.preloader is not None and not self.preloader.done:
+            bar = pygame.Rect(0, 0, 300, 8)
+            bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
+            pygame.draw.rect(screen, (255, 255, 255), bar, 1)
+            filled = bar.copy()
+            filled.width = int(bar.width * self.preloader.progress)
+            pygame.draw.rect(screen, (255, 255, 255), filled)
+
+
+class GameOverScene(Scene):
+    """Pantalla de Game Over con opciones."""
+
+    OPTIONS = ["Intentar de nuevo", "Salir"]
+
+    def __init__(self, manager, game):
+        super().__init__(manager)
+        self.game = game
+        self.selected_option = 0
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_DOWN:  # Mover selección hacia abajo
+            self.selected_option = (self.selected_option + 1) % len(self.OPTIONS)
+        if event.key == pygame.K_UP:  # Mover selección hacia arriba
+            self.selected_option = (self.selected_option - 1) % len(self.OPTIONS)
+        if event.key == pygame.K_RETURN:  # Confirmar selección
+            if self.selected_option == 0:  # Intentar de nuevo
+                self.manager.switch(self.game)
+            else:  # Salir
+                self.manager.quit()
+
+    def render(self, screen):
+        screen.fill((0, 0, 0))
+        game_over_text = render_text("GAME OVER", 74, (255, 0, 0))
+        screen.blit(game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)))
+
+        # Dibujar las opciones de menú
+        for i, option in enumerate(self.OPTIONS):
+            color = (255, 255, 0) if i == self.selected_option else (255, 255, 255)
+            option_text = render_text(option, 36, color)
+            screen.blit(option_text, option_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + i * 50)))
+
+
+class VictoryScene(Scene):
+    """Pantalla de victoria."""
+
+    def render(self, screen):
+        screen.fill((0, 0, 0))
+        victory_text = render_text("Has ganado", 74, (255, 255, 0))
+        screen.blit(victory_text, victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+
+
+def create_enemies(player_rect, screen_width, screen_height, count=ENEMY_COUNT, speed=3, seed=None,
+                   level=None, min_distance=ENEMY_SPAWN_DISTANCE):
+    """
+    Genera un grupo de enemigos asegurándose de que ninguno esté en la misma posición que el jugador.
+
+    Con ``level``, cada enemigo aparece centrado en una celda libre, con camino
+    hasta el jugador y a al menos ``min_distance`` pasos de él, sorteada en O(1)
+    con ``Level.spawn_index`` (sin reintentos, para cualquier cantidad). Si
+    ninguna celda cumple, el mínimo baja a la mitad de la distancia más lejana
+    alcanzable (las celdas sin camino también valen); si el nivel no tiene
+    ninguna celda libre fuera de los bordes y del jugador, no hay enemigos.
+    Sin ``level``, se sortean posiciones en toda el área evitando solo al jugador.
+
+    Con la misma ``seed`` se obtienen las mismas posiciones y el mismo movimiento
+    (se usa para grabar y reproducir partidas). Con ``level``, el sorteo de
+    posiciones y el enjambre usan flujos independientes derivados de ``seed``.
+    """
+    if level is not None:
+        # Margen y separación para que el sprite no salga del nivel ni toque al jugador
+        margin = -(-(ENEMY_SIZE - TILE_SIZE) // (2 * TILE_SIZE))
+        clearance = (ENEMY_SIZE + max(player_rect.size) + TILE_SIZE) // (2 * TILE_SIZE) + 1
+        index = level.spawn_index(level.cell_at(*player_rect.center), margin, clearance)
+        spawn_seed, swarm_seed = np.random.SeedSequence(seed).spawn(2)
+        rng = np.random.default_rng(spawn_seed)
+        if len(index) == 0:
+            cells = np.empty((0, 2), dtype=np.int64)  # Nivel demasiado chico: sin enemigos
+        else:
+            try:
+                cells = index.sample(count, rng, min_distance)
+            except ValueError:
+                floor = min(min_distance, index.max_distance // 2)
+                cells = index.sample(count, rng, floor, reachable=False)
+        positions = cells * TILE_SIZE + (TILE_SIZE - ENEMY_SIZE) // 2
+        return EnemySwarm(positions, speed, seed=swarm_seed)
+
+    rng = random.Random(seed) if seed is not None else random
+    positions = []
+    while len(positions) < count:
+        enemy_x = rng.randint(0, screen_width - 40)  # Tamaño ajustado para el sprite del enemigo
+        enemy_y = rng.randint(0, screen_height - 40)
+        enemy_rect = pygame.Rect(enemy_x, enemy_y, 40, 40)  # Tamaño del enemigo
+        if not enemy_rect.colliderect(player_rect):  # Verificar que no colisione con el jugador
+            positions.append((enemy_x, enemy_y))
+    return EnemySwarm(positions, speed, seed=seed)
+
+
+class GameScene(Scene):
+    """
+    Partida: recorre la lista de niveles; cada ``enter`` (re)inicia el nivel actual.
+
+    El siguiente nivel se prepara en segundo plano mientras se juega (ver ``LevelStream``).
+    """
+
+    def __init__(self, manager, levels=None, initial_position=None, recorder=None):
+        super().__init__(manager)
+        # Lista de niveles, con el siguiente precargado
+        self.levels = LevelStream(levels or [resource_path(level) for level in LEVELS], manager.screen)
+        self.initial_position = initial_position  # Posición inicial fija del jugador (None: la de cada nivel)
+        self.recorder = recorder  # game.replay.Recorder: graba cada intento de nivel (main.py --record)
+
+        # Iluminación (filtro de noche y máscaras de luz precalculadas)
+        self.lighting = Lighting(NIGHT_OPACITY, darkness=DARKNESS_MODE)
+        self.fog = None  # Niebla de guerra del nivel actual (FOG_OF_WAR)
+        self.player = Player(*(initial_position or PLAYER_START))
+        self.level = None
+        self.enemies = None
+        self.simulation = None
+        self.camera = None
+        self.drawn = None  # Áreas dibujadas sobre el fondo en el último cuadro (rectángulos sucios)
+
+    def enter(self):
+        # Cargar y reproducir música del juego principal
+        if not pygame.mixer.music.get_busy():
+            pygame.mixer.music.load(resource_path("assets/music/Darkrai.mp3"))
+            pygame.mixer.music.play(-1)
+
+        # Tomar el nivel actual (normalmente ya preparado) y reiniciar posiciones del jugador y los enemigos
+        self.level = self.levels.current()
+        position = self.initial_position or self.level.start_position()
+        self.player.rect.topleft = position
+        seed = random.getrandbits(63)  # Semilla propia de cada intento, para poder reproducirlo
+        self.enemies = create_enemies(self.player.rect, *self.level.pixel_size(), speed=3, seed=seed, level=self.level)
+        if self.recorder is not None:
+            self.recorder.begin(self.levels.path, seed, position,
+                                len(self.enemies), 3, ENEMY_CHASE)
+
+        # Simulación a paso fijo, independiente de la velocidad de render
+        flow_field = FlowField(self.level) if ENEMY_CHASE else None
+        self.simulation = Simulation(self.level, self.player, self.enemies, flow_field=flow_field,
+                                     profiler=self.manager.profiler, recorder=self.recorder)
+        self.camera = Camera(self.level.pixel_size())
+        if FOG_OF_WAR and (self.fog is None or self.fog.field_of_view.level is not self.level):
+            self.fog = Fog(self.level)  # Al reintentar el mismo nivel se conservan sus campos de visión
+        self.drawn = None
+
+    def exit(self):
+        self.levels.close()  # Sin hilo de precarga fuera de la partida; enter lo vuelve a crear
+
+    def invalidate(self):
+        self.drawn = None
+
+    def update(self, elapsed):
+        # Avanzar jugador, enemigos y meta según el tiempo real transcurrido
+        result = self.simulation.advance(elapsed, pygame.key.get_pressed())
+
+        if result == GAME_OVER:  # Colisión entre los enemigos y el jugador
+            print("¡Game Over!")
+            self.manager.switch(GameOverScene(self.manager, self))
+        elif result == GOAL:  # El jugador alcanzó la meta
+            print(f"¡Nivel {self.levels.index + 1} completado!")
+            if not self.levels.advance():  # Si no hay más niveles (se vuelve al primero)
+                self.manager.switch(StartScene(self.manager, self))  # Volver a la pantalla de inicio
+            else:
+                self.manager.switch(self, fade_out=0)
+        else:
+            self.levels.poll()  # Armar el siguiente nivel si el hilo ya lo compiló
+
+        # Actualizar animaciones del jugador; los sonidos se atenúan según su distancia a él
+        voices.listener = self.player.rect.center
+        self.player.update()
+
+    def render(self, screen):
+        # Renderizar el nivel, el jugador y los enemigos (posiciones interpoladas)
+        player_position = self.simulation.interpolated(self.player)
+        player_view = pygame.Rect(player_position, self.player.rect.size)
+        self.camera.follow(player_view)
+        profiler = self.manager.profiler
+
+        # Luz alrededor del jugador y la meta (solo en modo oscuridad)
+        lights = [(self.camera.apply(player_view.center), PLAYER_LIGHT_RADIUS)]
+        if self.level.goal:
+            lights.append((self.camera.apply(self.level.goal.center), GOAL_LIGHT_RADIUS))
+        light_areas = self.lighting.light_areas(lights)
+
+        # Rectángulos sucios: si la cámara no se mueve (el nivel cabe en la pantalla), solo se
+        # restaura el fondo donde hubo sprites o luces en el cuadro anterior y donde hay luces ahora
+        restored = None
+        if (self.manager.dirty_rects and self.drawn is not None and self.level.fits_screen()
+                and self.level.static_surface is not None and self.fog is None):
+            restored = self.drawn + light_areas
+
+        if restored is None:
+            with profiler.span("level.render"):
+                self.level.render(self.camera)
+        with profiler.span("lighting.render"):
+            # Con rectángulos sucios, el fondo se restaura junto con la iluminación
+            self.lighting.render(screen, lights, restored, self.level.static_surface)
+
+        with profiler.span("player.render"):
+            player_area = self.player.render(screen, self.camera.apply(player_position))
+        with profiler.span("enemies.render"):
+            enemy_areas = self.enemies.render(screen, self.simulation.alpha, self.camera.offset)
+
+        # Niebla de guerra sobre todo lo que el jugador no ve (la capa solo cambia al cambiar de celda)
+        if self.fog is not None:
+            with profiler.span("fog.render"):
+                self.fog.update(self.level.cell_at(*self.player.get_collider_rect().center), self.camera.rect)
+                self.fog.render(screen, self.camera.offset)
+
+        self.drawn = [player_area] + enemy_areas + light_areas
+        return None if restored is None else restored + self.drawn
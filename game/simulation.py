@@ -0,0 +1,158 @@
+# game/simulation.py
+import os
+from collections import defaultdict
+
+import pygame
+
+from game.config import TICK_RATE, MAX_CATCH_UP_TICKS
+from game.profiler import FrameProfiler
+
+# Resultados posibles de un paso de simulación
+GAME_OVER = "game_over"
+GOAL = "goal"
+
+
+def pressed(*key_codes):
+    """Crea un estado de teclado sintético con las teclas indicadas presionadas."""
+    keys = defaultdict(bool)
+    for key in key_codes:
+        keys[key] = True
+    return keys
+
+
+def init_headless():
+    """
+    Inicializa pygame con los drivers ``dummy`` de SDL (sin ventana ni audio real).
+
+    Debe llamarse antes que cualquier otra inicialización de pygame.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode((1, 1))
+
+
+class Simulation:
+    """
+    Lógica del nivel (jugador, enemigos y meta) avanzada a paso fijo.
+
+    ``enemy`` puede ser un ``Enemy`` o un ``EnemySwarm``: ambos exponen
+    ``move(bounds, level)`` y ``collides(rect)``; los enemigos rebotan contra
+    los bordes del nivel y contra sus paredes.
+
+    El bucle principal llama a ``advance`` con el tiempo real transcurrido;
+    la simulación ejecuta tantos pasos de ``1 / tick_rate`` segundos como
+    quepan (hasta ``max_catch_up``) y guarda las posiciones anteriores para
+    que el render pueda interpolar con ``alpha``.
+    """
+
+    def __init__(self, level, player, enemy, tick_rate=TICK_RATE, max_catch_up=MAX_CATCH_UP_TICKS,
+                 flow_field=None, profiler=None, recorder=None):
+        self.level = level
+        self.player = player
+        self.enemy = enemy
+        self.flow_field = flow_field  # Si se indica, los enemigos persiguen al jugador
+        self.profiler = profiler or FrameProfiler(enabled=False)
+        self.recorder = recorder  # Si se indica (game.replay.Recorder), graba las teclas de cada paso
+        self.dt = 1.0 / tick_rate
+        self.max_catch_up = max_catch_up
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.bounds = level.pixel_size()
+        self.previous = {}  # entidad -> posición al inicio del último paso
+        self.remember_positions()
+
+    def remember_positions(self):
+        """Guarda la posición actual de cada entidad como punto de partida de la interpolación."""
+        self.previous[self.player] = self.player.rect.topleft
+        if hasattr(self.enemy, "rect"):  # EnemySwarm guarda sus propias posiciones anteriores
+            self.previous[self.enemy] = self.enemy.rect.topleft
+
+    def step(self, keys=None):
+        """
+        Ejecuta un único paso de simulación.
+
+        Args:
+            keys: Estado de las teclas para este paso (ver ``Player.handle_input``).
+
+        Returns:
+            str: ``GAME_OVER``, ``GOAL`` o None si el nivel sigue en curso.
+        """
+        self.remember_positions()
+        if self.recorder is not None:
+            if keys is None:
+                keys = pygame.key.get_pressed()
+            self.recorder.record(keys)
+        with self.profiler.span("player.handle_input"):
+            self.player.handle_input(self.level, keys)
+        with self.profiler.span("enemy.move"):
+            if self.flow_field is not None:
+                self.enemy.chase(self.flow_field, self.level.cell_at(*self.player.get_collider_rect().center))
+            self.enemy.move(self.bounds, self.level)
+        self.ticks += 1
+
+        result = None
+        if self.enemy.collides(self.player.rect):
+            result = GAME_OVER
+        elif self.level.goal and self.player.get_collider_rect().colliderect(self.level.goal):
+            result = GOAL
+        if result is not None and self.recorder is not None:
+            self.recorder.end(result)
+        return result
+
+    def advance(self, elapsed, keys=None):
+        """
+        Avanza la simulación según el tiempo real transcurrido.
+
+        Args:
+            elapsed (float): Segundos desde la llamada anterior.
+            keys: Estado de las teclas, reutilizado en todos los pasos recuperados.
+
+        Returns:
+            str: El primer resultado distinto de None de los pasos ejecutados.
+        """
+        self.accumulator += elapsed
+        steps = 0
+        while self.accumulator >= self.dt:
+            if steps >= self.max_catch_up:
+                # Cuadro demasiado lento: descartar el tiempo restante en vez de acumular retraso
+                self.accumulator = 0.0
+                break
+            self.accumulator -= self.dt
+            steps += 1
+            result = self.step(keys)
+            if result is not None:
+                self.accumulator = 0.0
+                return result
+        return None
+
+    @property
+    def alpha(self):
+        """Fracción del paso actual ya transcurrida (0 a 1), para interpolar el render."""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def interpolated(self, entity):
+        """Posición de ``entity`` interpolada entre el paso anterior y el actual."""
+        previous_x, previous_y = self.previous.get(entity, entity.rect.topleft)
+        alpha = self.alpha
+        return (
+            round(previous_x + (entity.rect.x - previous_x) * alpha),
+            round(previous_y + (entity.rect.y - previous_y) * alpha),
+        )
+
+    def run(self, ticks, keys=None):
+        """
+        Ejecuta hasta ``ticks`` pasos lo más rápido posible, sin renderizar.
+
+        Args:
+            ticks (int): Número máximo de pasos.
+            keys: Estado fijo de las teclas, o una función ``keys(tick)`` que lo devuelva.
+
+        Returns:
+            str: El resultado que detuvo la simulación, o None si se completaron los pasos.
+        """
+        for _ in range(ticks):
+            result = self.step(keys(self.ticks) if callable(keys) else keys)
+            if result is not None:
+                return result
+        return None
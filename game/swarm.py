@@ -0,0 +1,179 @@
+# game/swarm.py
+import numpy as np
+import pygame
+
+from game.assets import load_frames
+from game.audio import voices
+from game.config import TILE_SIZE, ENEMY_SIZE
+
+
+class EnemySwarm:
+    """
+    Grupo de enemigos almacenado en arreglos de NumPy.
+
+    Posiciones, direcciones y velocidades de los N enemigos viven en arreglos
+    y todo el movimiento (cambios de dirección aleatorios, rebotes con los
+    bordes y las paredes, colisión con el jugador) se calcula en lote. Todos
+    comparten los mismos cuadros de animación, cada uno con un desfase propio.
+    """
+
+    CHANGE_DIRECTION_CHANCE = 51  # Igual que random.randint(0, 50) == 0 en Enemy.move
+
+    def __init__(self, positions, speed=2, size=(ENEMY_SIZE, ENEMY_SIZE), seed=None):
+        """
+        Inicializa el grupo.
+
+        Args:
+            positions: Secuencia de posiciones iniciales (x, y), una por enemigo.
+            speed (int | sequence): Velocidad común o una por enemigo (píxeles por paso).
+            size (tuple): Tamaño de cada enemigo (igual al de los cuadros).
+            seed (int): Semilla del generador aleatorio (o ``numpy.random.SeedSequence``), para corridas
+                reproducibles.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.positions = np.array(positions, dtype=np.float64).reshape(-1, 2)
+        self.previous = self.positions.copy()  # Posiciones del paso anterior, para interpolar
+        count = len(self.positions)
+        self.speeds = np.broadcast_to(np.asarray(speed, dtype=np.float64), (count,)).copy()
+        self.directions = self.rng.integers(-1, 2, size=(count, 2))
+        self.size = np.array(size, dtype=np.float64)
+
+        # Márgenes del colisionador (como Enemy.collider_margin)
+        self.collider_margin = {"left": 20, "right": 20, "top": 20, "bottom": 20}
+
+        # Animación compartida
+        self.frames = load_frames("assets/images/enemy_frames", size)
+        self.frame_offsets = self.rng.integers(0, len(self.frames), size=count)
+        self.current_frame = 0
+        self.animation_speed = 100  # Milisegundos entre cuadros
+        self.last_update = pygame.time.get_ticks()
+
+    def __len__(self):
+        return len(self.positions)
+
+    def move(self, bounds=None, level=None):
+        """
+        Mueve a todos los enemigos un paso.
+
+        Args:
+            bounds (tuple): Ancho y alto del área en la que rebotan. Por defecto, el tamaño de la pantalla.
+            level (Level): Si se indica, los enemigos también rebotan contra las paredes de su rejilla.
+
+        Returns:
+            int: Cantidad de enemigos que cambiaron de dirección en este paso.
+        """
+        if bounds is None:
+            bounds = pygame.display.get_surface().get_size()
+        count = len(self.positions)
+        self.previous[:] = self.positions
+
+        # Cambiar dirección aleatoriamente
+        change = self.rng.integers(0, self.CHANGE_DIRECTION_CHANCE, size=count) == 0
+        changed = 0
+        turned = np.zeros(count, dtype=bool)  # Enemigos que cambiaron de dirección (para el sonido)
+        if change.any():
+            new_directions = self.rng.integers(-1, 2, size=(int(change.sum()), 2))
+            different = (new_directions != self.directions[change]).any(axis=1)
+            changed = int(different.sum())
+            turned[np.flatnonzero(change)[different]] = True
+            self.directions[change] = new_directions
+
+        # Actualizar posición
+        self.positions += self.directions * self.speeds[:, None]
+
+        # Rebotar contra las paredes del nivel (celda bajo el centro del colisionador)
+        if level is not None and level.cols and level.rows:
+            grid = np.frombuffer(level.grid, dtype=np.uint8).reshape(level.rows, level.cols)
+            centers = self.positions + self.size / 2
+            cells = (centers // TILE_SIZE).astype(np.intp)
+            inside = ((cells[:, 0] >= 0) & (cells[:, 0] < level.cols)
+                      & (cells[:, 1] >= 0) & (cells[:, 1] < level.rows))
+            blocked = np.zeros(count, dtype=bool)
+            blocked[inside] = grid[cells[inside, 1], cells[inside, 0]] == 1
+            if blocked.any():
+                self.positions[blocked] = self.previous[blocked]
+                self.directions[blocked] *= -1
+                changed += int(blocked.sum())
+                turned |= blocked
+
+        # Mantener a los enemigos dentro de los límites
+        limits = np.array(bounds, dtype=np.float64) - self.size
+        low = self.positions < 0
+        high = self.positions > limits
+        bounced = low | high
+        if bounced.any():
+            np.clip(self.positions, 0, np.maximum(limits, 0), out=self.positions)
+            self.directions[bounced] *= -1
+            changed += int(bounced.any(axis=1).sum())
+            turned |= bounced.any(axis=1)
+
+        if changed and voices.can_play("flying"):
+            # Un solo sonido por paso, sin importar N, desde el enemigo más cercano al oyente
+            centers = self.positions[turned] + self.size / 2
+            voices.play("flying", voices.nearest(centers.tolist()))
+        return changed
+
+    def chase(self, flow_field, target):
+        """
+        Orienta a los enemigos hacia ``target`` siguiendo un ``FlowField`` compartido.
+
+        Cada enemigo lee la dirección de la celda bajo su centro (O(1) por enemigo);
+        los que están fuera del laberinto o sin camino conservan su dirección.
+
+        Args:
+            flow_field (FlowField): Campo de direcciones del nivel.
+            target (tuple): Celda (col, row) a perseguir, normalmente la del jugador.
+        """
+        cells = ((self.positions + self.size / 2) // TILE_SIZE).astype(np.intp)
+        directions, known = flow_field.directions(cells, target)
+        self.directions[known] = directions[known]
+
+    def hits(self, rect):
+        """Devuelve una máscara booleana con los enemigos cuyo rectángulo toca ``rect``."""
+        x = self.positions[:, 0]
+        y = self.positions[:, 1]
+        width, height = self.size
+        return ((x < rect.right) & (x + width > rect.left)
+                & (y < rect.bottom) & (y + height > rect.top))
+
+    def collides(self, rect):
+        """Indica si algún enemigo toca ``rect``."""
+        return bool(self.hits(rect).any())
+
+    def collider_rects(self):
+        """Devuelve los colisionadores ajustados de todos los enemigos (para depuración)."""
+        margin = self.collider_margin
+        width = int(self.size[0]) - margin["left"] - margin["right"]
+        height = int(self.size[1]) - margin["top"] - margin["bottom"]
+        return [pygame.Rect(int(x) + margin["left"], int(y) + margin["top"], width, height)
+                for x, y in self.positions]
+
+    def animate(self):
+        """Avanza el cuadro de animación compartido."""
+        now = pygame.time.get_ticks()
+        if now - self.last_update > self.animation_speed:
+            self.last_update = now
+            self.current_frame = (self.current_frame + 1) % len(self.frames)
+
+    def render(self, screen, alpha=1.0, offset=(0, 0)):
+        """
+        Dibuja los enemigos visibles en un único ``blits``.
+
+        Args:
+            screen (pygame.Surface): Superficie destino.
+            alpha (float): Fracción de interpolación entre el paso anterior y el actual.
+            offset (tuple): Esquina de la cámara en el mundo (ver ``Camera.offset``).
+
+        Returns:
+            list: Áreas de la pantalla modificadas, una por enemigo visible.
+        """
+        self.animate()
+        positions = self.previous + (self.positions - self.previous) * alpha - offset
+        width, height = screen.get_size()
+        visible = ((positions[:, 0] < width) & (positions[:, 0] + self.size[0] > 0)
+                   & (positions[:, 1] < height) & (positions[:, 1] + self.size[1] > 0))
+        indices = np.flatnonzero(visible)
+        frame_indices = (self.frame_offsets[indices] + self.current_frame) % len(self.frames)
+        frames = self.frames
+        return screen.blits([(frames[frame], (x, y)) for frame, (x, y)
+                             in zip(frame_indices.tolist(), positions[indices].astype(np.int32).tolist())])
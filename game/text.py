@@ -0,0 +1,25 @@
+# game/text.py
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=None)
+def get_font(size, name=None):
+    """Devuelve una fuente compartida (``name=None`` usa la fuente por defecto de pygame)."""
+    return pygame.font.Font(name, size)
+
+
+@lru_cache(maxsize=256)
+def render_text(text, size, color, name=None, antialias=True):
+    """
+    Devuelve la superficie de un texto, renderizada una sola vez por texto, fuente y color.
+
+    Args:
+        text (str): Texto a renderizar.
+        size (int): Tamaño de la fuente.
+        color (tuple): Color RGB.
+        name (str): Archivo de fuente, o None para la fuente por defecto.
+        antialias (bool): Suavizado de bordes.
+    """
+    return get_font(size, name).render(text, antialias, color)
@@ -0,0 +1,208 @@
+# game/visibility.py
+"""
+Campo de visión sobre la rejilla de paredes y niebla de guerra.
+
+``shadowcast`` recorre los ocho octantes alrededor de una celda con el
+algoritmo recursivo de sombras (shadowcasting): cada pared corta el
+abanico de pendientes visibles de las filas siguientes. Las paredes
+bloquean la vista pero se ven. El costo depende del radio, no del tamaño
+del laberinto.
+
+``FieldOfView`` guarda el resultado por celda en una caché LRU, y
+``Fog`` arma con él una capa de niebla alineada a la rejilla que solo se
+vuelve a construir cuando el jugador cambia de celda (o la cámara sale de
+la zona cubierta); cada cuadro es un único ``blit``.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from game.config import TILE_SIZE, FOV_RADIUS, FOG_OPACITY, NIGHT_COLOR
+
+# Multiplicadores (xx, xy, yx, yy) que llevan el octante base a cada uno de los ocho
+OCTANTS = ((1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+           (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1))
+
+
+def shadowcast(level, origin, radius=FOV_RADIUS):
+    """
+    Celdas visibles desde ``origin`` dentro de ``radius``.
+
+    Args:
+        level: ``Level`` o ``Grid`` (``cols``, ``rows`` y ``grid`` con 1 = pared).
+        origin (tuple): Celda (col, row) del observador.
+        radius (int): Alcance de la vista en celdas.
+
+    Returns:
+        bytearray: Ventana de ``(2 * radius + 1) ** 2`` bytes (1 = visible), fila por fila,
+        centrada en ``origin``. Las celdas fuera de la rejilla no son visibles.
+    """
+    cols, rows, grid = level.cols, level.rows, level.grid
+    cx, cy = origin
+    size = 2 * radius + 1
+    visible = bytearray(size * size)
+    if 0 <= cx < cols and 0 <= cy < rows:
+        visible[radius * size + radius] = 1
+    radius_squared = radius * radius
+
+    def cast(row, start, end, xx, xy, yx, yy):
+        # Octante base: filas hacia arriba (dy = -j), pendientes de ``start`` (1) a ``end`` (0)
+        if start < end:
+            return
+        new_start = start
+        for j in range(row, radius + 1):
+            dy = -j
+            blocked = False
+            for dx in range(-j, 1):
+                left_slope = (dx - 0.5) / (dy + 0.5)
+                right_slope = (dx + 0.5) / (dy - 0.5)
+                if start < right_slope:
+                    continue
+                if end > left_slope:
+                    break
+
+                x = cx + dx * xx + dy * xy
+                y = cy + dx * yx + dy * yy
+                inside = 0 <= x < cols and 0 <= y < rows
+                if inside and dx * dx + dy * dy <= radius_squared:
+                    visible[(y - cy + radius) * size + (x - cx + radius)] = 1
+
+                wall = not inside or grid[y * cols + x]
+                if blocked:
+                    if wall:
+                        new_start = right_slope
+                    else:
+                        blocked = False
+                        start = new_start
+                elif wall and j < radius:
+                    # La pared abre una sombra: lo que queda a su izquierda se recorre aparte
+                    blocked = True
+                    cast(j + 1, start, left_slope, xx, xy, yx, yy)
+                    new_start = right_slope
+            if blocked:
+                break
+
+    for octant in OCTANTS:
+        cast(1, 1.0, 0.0, *octant)
+    return visible
+
+
+class FieldOfView:
+    """
+    Campos de visión de un nivel, calculados una vez por celda.
+
+    Igual que ``FlowField``, los resultados se guardan en una caché LRU
+    indexada por la celda del observador.
+    """
+
+    def __init__(self, level, radius=FOV_RADIUS, cache_size=256):
+        self.level = level
+        self.radius = radius
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._fields = OrderedDict()  # celda -> ventana de visibilidad (ver shadowcast)
+
+    def visible(self, cell):
+        """Ventana de visibilidad (bytearray, ver ``shadowcast``) desde ``cell``."""
+        cell = tuple(cell)
+        field = self._fields.get(cell)
+        if field is not None:
+            self.hits += 1
+            self._fields.move_to_end(cell)
+            return field
+
+        self.misses += 1
+        field = self._fields[cell] = shadowcast(self.level, cell, self.radius)
+        if len(self._fields) > self.cache_size:
+            self._fields.popitem(last=False)
+        return field
+
+    def mask(self, cell):
+        """Ventana de visibilidad como arreglo booleano (filas, columnas) de lado ``2 * radius + 1``."""
+        size = 2 * self.radius + 1
+        return np.frombuffer(self.visible(cell), dtype=np.uint8).reshape(size, size).astype(bool)
+
+    def is_visible(self, origin, cell):
+        """Indica si ``cell`` se ve desde ``origin``."""
+        dx, dy = cell[0] - origin[0], cell[1] - origin[1]
+        if abs(dx) > self.radius or abs(dy) > self.radius:
+            return False
+        size = 2 * self.radius + 1
+        return bool(self.visible(origin)[(dy + self.radius) * size + dx + self.radius])
+
+
+class Fog:
+    """
+    Niebla de guerra: oscurece las celdas que el jugador no ve.
+
+    La capa cubre la ventana de la cámara más una celda de margen, alineada a
+    la rejilla, con un píxel por celda escalado a ``TILE_SIZE``.
+    """
+
+    def __init__(self, level, radius=FOV_RADIUS, opacity=FOG_OPACITY, color=NIGHT_COLOR):
+        """
+        Args:
+            level (Level): Nivel cuyas paredes bloquean la vista.
+            radius (int): Alcance de la vista en celdas.
+            opacity (int): Opacidad de la niebla (0-255) en las celdas no visibles.
+            color (tuple): Color de la niebla.
+        """
+        self.field_of_view = FieldOfView(level, radius)
+        self.opacity = opacity
+        self.color = color
+        self.cell = None
+        self.area = None  # Rectángulo del mundo (píxeles) que cubre la capa actual
+        self.overlay = None
+        self.rebuilds = 0
+
+    def update(self, cell, view):
+        """
+        Rehace la capa si el jugador cambió de celda o la cámara salió de la zona cubierta.
+
+        Args:
+            cell (tuple): Celda (col, row) del jugador.
+            view (pygame.Rect): Ventana de la cámara en coordenadas del mundo.
+
+        Returns:
+            bool: Si la capa se volvió a construir.
+        """
+        cell = tuple(cell)
+        if cell == self.cell and self.area is not None and self.area.contains(view):
+            return False
+        self.cell = cell
+        self.overlay, self.area = self.build(cell, view)
+        self.rebuilds += 1
+        return True
+
+    def build(self, cell, view):
+        """Construye la capa de niebla para ``cell`` que cubre ``view``; devuelve ``(superficie, área)``."""
+        left, top = view.left // TILE_SIZE - 1, view.top // TILE_SIZE - 1
+        cols = (view.right - 1) // TILE_SIZE + 2 - left
+        rows = (view.bottom - 1) // TILE_SIZE + 2 - top
+
+        # Alfa por celda de la zona (x, y como pygame.surfarray); 0 donde se ve
+        alpha = np.full((cols, rows), self.opacity, dtype=np.uint8)
+        radius = self.field_of_view.radius
+        mask = self.field_of_view.mask(cell)
+        origin_x, origin_y = cell[0] - radius - left, cell[1] - radius - top
+        x0, y0 = max(origin_x, 0), max(origin_y, 0)
+        x1, y1 = min(origin_x + mask.shape[1], cols), min(origin_y + mask.shape[0], rows)
+        if x0 < x1 and y0 < y1:
+            window = mask[y0 - origin_y:y1 - origin_y, x0 - origin_x:x1 - origin_x].T
+            alpha[x0:x1, y0:y1][window] = 0
+
+        cells = pygame.Surface((cols, rows), pygame.SRCALPHA)
+        cells.fill((*self.color, 0))
+        pixels = pygame.surfarray.pixels_alpha(cells)
+        pixels[:] = alpha
+        del pixels  # Liberar el bloqueo de la superficie
+        overlay = pygame.transform.scale(cells, (cols * TILE_SIZE, rows * TILE_SIZE))
+        area = pygame.Rect(left * TILE_SIZE, top * TILE_SIZE, cols * TILE_SIZE, rows * TILE_SIZE)
+        return overlay, area
+
+    def render(self, screen, offset=(0, 0)):
+        """Dibuja la capa de niebla (un único ``blit``); ``offset`` es la esquina de la cámara."""
+        if self.overlay is not None:
+            screen.blit(self.overlay, (self.area.x - offset[0], self.area.y - offset[1]))
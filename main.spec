@@ -1,11 +1,28 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+
+import pygame
+
+from game.atlas import PACKED_FOLDERS, build_atlases
+
+# Empaquetar los sprites en atlas antes de armar el ejecutable
+pygame.init()
+build_atlases()
+
+# Recursos: todo assets/ menos las carpetas que ya están dentro de un atlas
+datas = []
+for folder, _, files in os.walk('assets'):
+    if any(folder.replace(os.sep, '/').startswith(packed) for packed in PACKED_FOLDERS):
+        continue
+    if files:
+        datas.append((os.path.join(folder, '*'), folder))
 
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets', 'assets')],
+    datas=datas,
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,38 @@
+# tests/test_assets.py
+import os
+
+import pygame
+import pytest
+
+from game.assets import AssetCache
+from game.atlas import ENEMY_FRAMES, enemy_sources, pack
+from game.simulation import init_headless
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.chdir(ROOT)  # resource_path resuelve desde la carpeta actual
+    init_headless()
+    yield pygame.display.set_mode((800, 600))
+    pygame.quit()
+
+
+def test_small_budget_does_not_evict_atlas(screen, tmp_path):
+    """Con un presupuesto menor que el atlas, cada cuadro falta una vez y el atlas se decodifica una sola vez."""
+    entry = pack("enemy", enemy_sources(), str(tmp_path))
+    atlas_path = str(tmp_path / "enemy.png")
+    cache = AssetCache(max_bytes=2 * 2 ** 20, policy="evict")
+    cache._atlas_frames = {key: (atlas_path, tuple(rect)) for key, rect in entry["frames"].items()}
+    cache._atlas_folders = {}
+    count = len(cache.listing(ENEMY_FRAMES))
+
+    frames = cache.frames(ENEMY_FRAMES, size=(120, 120))
+    assert len(frames) == count
+    assert cache.misses <= count + 1  # Cada cuadro y el atlas
+
+    # Segunda pasada: los cuadros descartados vuelven a faltar, el atlas no
+    cache.frames(ENEMY_FRAMES, size=(120, 120))
+    assert cache.misses <= 2 * count + 1
+    assert cache.evictions < 2 * count